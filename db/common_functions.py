@@ -37,8 +37,18 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
             "specify a different database file?".format(os.path.abspath(db_path))
         )
 
-    conn = sqlite3.connect(db_path, timeout=timeout, detect_types=detect_types)
+    # Keep more prepared statements in the connection's statement cache
+    # (default is 128)
+    conn = sqlite3.connect(
+        db_path, timeout=timeout, detect_types=detect_types, cached_statements=256
+    )
 
+    # Keep temporary tables and indices in memory and increase the page
+    # cache size (negative values are in KiB, so this is 64 MiB)
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")
+    # Use memory-mapped I/O (up to 256 MiB) for reads
+    conn.execute("PRAGMA mmap_size=268435456;")
     # Enforce foreign keys (default = not enforced)
     conn.execute("PRAGMA foreign_keys=ON;")
 
@@ -46,7 +56,15 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
 
 
 def spin_on_database_lock(
-    conn, cursor, sql, data, many=True, max_attempts=61, interval=10, quiet=True
+    conn,
+    cursor,
+    sql,
+    data,
+    many=True,
+    max_attempts=61,
+    interval=10,
+    quiet=True,
+    commit=True,
 ):
     """
     :param conn: the connection object
@@ -61,6 +79,10 @@ def spin_on_database_lock(
         the lock has been released; the default is 10 seconds, but that can
         be overridden
     :param quiet: boolean; set to False to see the SQL query
+    :param commit: boolean for whether to commit after executing the
+        statement; the default is True, but callers that batch several
+        statements into one transaction can set it to False and commit
+        themselves
 
     If the database is locked, wait for the lock to be released for a
     certain amount of time and occasionally retry to execute the SQL
@@ -86,7 +108,8 @@ def spin_on_database_lock(
                 cursor.executemany(sql, data)
             else:
                 cursor.execute(sql, data)
-            conn.commit()
+            if commit:
+                conn.commit()
         except sqlite3.OperationalError as e:
             if "locked" in str(e):
                 print(
@@ -35,6 +35,86 @@ import sys
 from db.common_functions import spin_on_database_lock
 
 
+# The directory with the GridPath structural data CSV files
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "data")
+
+# The GridPath structural data to load: the name of the database table
+# (the data are in a CSV file with the same name in the data directory) and
+# the table columns in the order they appear in the CSV file
+AUX_DATA = [
+    # General model data
+    ("mod_months", ("month", "description")),
+    ("mod_capacity_types", ("capacity_type", "description")),
+    ("mod_availability_types", ("availability_type", "description")),
+    ("mod_operational_types", ("operational_type", "description")),
+    ("mod_reserve_types", ("reserve_type", "description")),
+    ("mod_tx_capacity_types", ("capacity_type", "description")),
+    ("mod_tx_availability_types", ("availability_type", "description")),
+    ("mod_tx_operational_types", ("operational_type", "description")),
+    ("mod_prm_types", ("prm_type", "description")),
+    (
+        "mod_capacity_and_operational_type_invalid_combos",
+        ("capacity_type", "operational_type"),
+    ),
+    (
+        "mod_tx_capacity_and_tx_operational_type_invalid_combos",
+        ("capacity_type", "operational_type"),
+    ),
+    ("mod_horizon_boundary_types", ("horizon_boundary_type", "description")),
+    ("mod_run_status_types", ("run_status_id", "run_status_name")),
+    ("mod_validation_status_types", ("validation_status_id", "validation_status_name")),
+    ("mod_features", ("feature", "description")),
+    ("mod_feature_subscenarios", ("feature", "subscenario_id")),
+    (
+        "mod_units",
+        (
+            "metric",
+            "type",
+            "numerator_core_units",
+            "denominator_core_units",
+            "unit",
+            "description",
+        ),
+    ),
+    # Data required for the UI
+    ("ui_scenario_detail_table_metadata", ("ui_table", "include", "ui_table_caption")),
+    (
+        "ui_scenario_detail_table_row_metadata",
+        (
+            "ui_table",
+            "ui_table_row",
+            "include",
+            "ui_row_caption",
+            "ui_row_db_scenarios_view_column",
+            "ui_row_db_subscenario_table",
+            "ui_row_db_subscenario_table_id_column",
+            "ui_row_db_input_table",
+        ),
+    ),
+    ("ui_scenario_results_table_metadata", ("results_table", "include", "caption")),
+    (
+        "ui_scenario_results_plot_metadata",
+        (
+            "results_plot",
+            "include",
+            "caption",
+            "load_zone_form_control",
+            "energy_target_zone_form_control",
+            "carbon_cap_zone_form_control",
+            "period_form_control",
+            "horizon_form_control",
+            "start_timepoint_form_control",
+            "end_timepoint_form_control",
+            "stage_form_control",
+            "project_form_control",
+            "commit_project_form_control",
+        ),
+    ),
+    # Data for plotting
+    ("viz_technologies", ("technology", "color", "plotting_order")),
+]
+
+
 def parse_arguments(arguments):
     """
 
@@ -102,195 +182,38 @@ def load_data(conn, omit_data, custom_units):
     :param omit_data:
     :param custom_units: Boolean, True if user-specified units
     :return:
+
+    All data are inserted in a single transaction that is committed once at
+    the end rather than after each table. Foreign key checks are deferred
+    to the commit, so they are not done row by row during the load.
     """
-    # TODO: refactor this
     if not omit_data:
-        # General Model Data
-        load_mod_months(conn=conn)
-        load_mod_capacity_types(conn=conn)
-        load_mod_availability_types(conn=conn)
-        load_mod_operational_types(conn=conn)
-        load_mod_reserve_types(conn=conn)
-        load_mod_tx_capacity_types(conn=conn)
-        load_mod_tx_availability_types(conn=conn)
-        load_mod_tx_operational_types(conn=conn)
-        load_mod_prm_types(conn=conn)
-        load_mod_capacity_and_operational_type_invalid_combos(conn=conn)
-        load_mod_tx_capacity_and_tx_operational_type_invalid_combos(conn=conn)
-        load_mod_horizon_boundary_types(conn=conn)
-        load_mod_run_status_types(conn=conn)
-        load_mod_validation_status_types(conn=conn)
-        load_mod_features(conn=conn)
-        load_mod_feature_subscenarios(conn=conn)
-        load_mod_units(conn=conn, custom_units=custom_units)
-
-        # Data required for the UI
-        load_ui_scenario_detail_table_metadata(conn=conn)
-        ui_scenario_detail_table_row_metadata(conn=conn)
-        load_ui_scenario_results_table_metadata(conn=conn)
-        load_ui_scenario_results_plot_metadata(conn=conn)
-
-        # Data for plotting
-        load_viz_technologies(conn=conn)
-
-    else:
-        pass
-
-
-def load_mod_months(conn):
-    sql = """
-        INSERT INTO mod_months
-        (month, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_months.csv", sql=sql)
-
-
-def load_mod_capacity_types(conn):
-    sql = """
-        INSERT INTO mod_capacity_types
-        (capacity_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_capacity_types.csv", sql=sql)
-
-
-def load_mod_availability_types(conn):
-    sql = """
-        INSERT INTO mod_availability_types
-        (availability_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_availability_types.csv", sql=sql)
-
-
-def load_mod_operational_types(conn):
-    sql = """
-        INSERT INTO mod_operational_types
-        (operational_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_operational_types.csv", sql=sql)
-
-
-def load_mod_reserve_types(conn):
-    sql = """
-        INSERT INTO mod_reserve_types
-        (reserve_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_reserve_types.csv", sql=sql)
-
-
-def load_mod_tx_capacity_types(conn):
-    sql = """
-        INSERT INTO mod_tx_capacity_types
-        (capacity_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_tx_capacity_types.csv", sql=sql)
-
-
-def load_mod_tx_availability_types(conn):
-    sql = """
-        INSERT INTO mod_tx_availability_types
-        (availability_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_tx_availability_types.csv", sql=sql)
-
-
-def load_mod_tx_operational_types(conn):
-    sql = """
-        INSERT INTO mod_tx_operational_types
-        (operational_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_tx_operational_types.csv", sql=sql)
-
-
-def load_mod_prm_types(conn):
-    sql = """
-        INSERT INTO mod_prm_types
-        (prm_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_prm_types.csv", sql=sql)
-
-
-def load_mod_capacity_and_operational_type_invalid_combos(conn):
-    sql = """
-        INSERT INTO 
-        mod_capacity_and_operational_type_invalid_combos
-        (capacity_type, operational_type)
-        VALUES (?, ?);"""
-    load_aux_data(
-        conn=conn,
-        filename="mod_capacity_and_operational_type_invalid_combos.csv",
-        sql=sql,
-    )
+        # The defer_foreign_keys pragma only applies to the current
+        # transaction and is switched off automatically on commit, so open
+        # the transaction explicitly first
+        conn.execute("BEGIN;")
+        conn.execute("PRAGMA defer_foreign_keys=ON;")
+        for table, columns in AUX_DATA:
+            load_aux_data(conn=conn, table=table, columns=columns)
 
+        update_mod_units(conn=conn, custom_units=custom_units)
 
-def load_mod_tx_capacity_and_tx_operational_type_invalid_combos(conn):
-    sql = """
-        INSERT INTO 
-        mod_tx_capacity_and_tx_operational_type_invalid_combos
-        (capacity_type, operational_type)
-        VALUES (?, ?);"""
-    load_aux_data(
-        conn=conn,
-        filename="mod_tx_capacity_and_tx_operational_type_invalid_combos.csv",
-        sql=sql,
-    )
-
-
-def load_mod_horizon_boundary_types(conn):
-    sql = """
-        INSERT INTO mod_horizon_boundary_types
-        (horizon_boundary_type, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_horizon_boundary_types.csv", sql=sql)
-
-
-def load_mod_run_status_types(conn):
-    sql = """
-        INSERT INTO mod_run_status_types
-        (run_status_id, run_status_name)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_run_status_types.csv", sql=sql)
-
+        conn.commit()
 
-def load_mod_validation_status_types(conn):
-    sql = """
-        INSERT INTO mod_validation_status_types
-        (validation_status_id, validation_status_name)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_validation_status_types.csv", sql=sql)
-
-
-def load_mod_features(conn):
-    sql = """
-        INSERT INTO mod_features
-        (feature, description)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_features.csv", sql=sql)
-
-
-def load_mod_feature_subscenarios(conn):
-    sql = """
-        INSERT INTO mod_feature_subscenarios
-        (feature, subscenario_id)
-        VALUES (?, ?);"""
-    load_aux_data(conn=conn, filename="mod_feature_subscenarios.csv", sql=sql)
+    else:
+        pass
 
 
-def load_mod_units(conn, custom_units):
+def update_mod_units(conn, custom_units):
     """
-    Load the units
+    Update the units loaded from mod_units.csv with any user-specified
+    units and derive the secondary units
     :param conn:
     :param custom_units: Boolean, True if user-specified units
     :return:
     """
     c = conn.cursor()
 
-    sql = """
-        INSERT INTO mod_units
-        (metric, type, numerator_core_units, denominator_core_units,
-        unit, description)
-        VALUES (?, ?, ?, ?, ?, ?);"""
-    load_aux_data(conn=conn, filename="mod_units.csv", sql=sql)
-
     if custom_units:
         # Retrieve settings from user
         power = input(
@@ -326,7 +249,7 @@ def load_mod_units(conn, custom_units):
                 SET unit = ?
                 WHERE metric = 'power'"""
             spin_on_database_lock(
-                conn=conn, cursor=c, sql=sql, many=False, data=(power,)
+                conn=conn, cursor=c, sql=sql, many=False, data=(power,), commit=False
             )
             # add energy units based on user's power units
             energy = power + "h"
@@ -334,28 +257,43 @@ def load_mod_units(conn, custom_units):
                 SET unit = ?
                 WHERE metric = 'energy'"""
             spin_on_database_lock(
-                conn=conn, cursor=c, sql=sql, many=False, data=(energy,)
+                conn=conn, cursor=c, sql=sql, many=False, data=(energy,), commit=False
             )
         if fuel_energy != "default":
             sql = """UPDATE mod_units
                 SET unit = ?
                 WHERE metric = 'fuel_energy'"""
             spin_on_database_lock(
-                conn=conn, cursor=c, sql=sql, many=False, data=(fuel_energy,)
+                conn=conn,
+                cursor=c,
+                sql=sql,
+                many=False,
+                data=(fuel_energy,),
+                commit=False,
             )
         if cost != "default":
             sql = """UPDATE mod_units
                 SET unit = ?
                 WHERE metric = 'cost'"""
             spin_on_database_lock(
-                conn=conn, cursor=c, sql=sql, many=False, data=(cost,)
+                conn=conn,
+                cursor=c,
+                sql=sql,
+                many=False,
+                data=(cost,),
+                commit=False,
             )
         if carbon_emissions != "default":
             sql = """UPDATE mod_units
                 SET unit = ?
                 WHERE metric = 'carbon_emissions'"""
             spin_on_database_lock(
-                conn=conn, cursor=c, sql=sql, many=False, data=(carbon_emissions,)
+                conn=conn,
+                cursor=c,
+                sql=sql,
+                many=False,
+                data=(carbon_emissions,),
+                commit=False,
             )
 
     # Derive secondary units
@@ -383,82 +321,45 @@ def load_mod_units(conn, custom_units):
             SET unit = ?
             WHERE metric = ?"""
         spin_on_database_lock(
-            conn=conn, cursor=c, sql=sql, many=False, data=(sec_unit, sec_metric)
+            conn=conn,
+            cursor=c,
+            sql=sql,
+            many=False,
+            data=(sec_unit, sec_metric),
+            commit=False,
         )
 
 
-def load_ui_scenario_detail_table_metadata(conn):
-    sql = """
-        INSERT INTO ui_scenario_detail_table_metadata
-        (ui_table, include, ui_table_caption)
-        VALUES (?, ?, ?);"""
-    load_aux_data(conn=conn, filename="ui_scenario_detail_table_metadata.csv", sql=sql)
-
-
-def ui_scenario_detail_table_row_metadata(conn):
-    sql = """
-        INSERT INTO ui_scenario_detail_table_row_metadata
-        (ui_table, ui_table_row, include, ui_row_caption,
-        ui_row_db_scenarios_view_column, 
-        ui_row_db_subscenario_table, 
-        ui_row_db_subscenario_table_id_column, 
-        ui_row_db_input_table)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-        """
-    load_aux_data(
-        conn=conn, filename="ui_scenario_detail_table_row_metadata.csv", sql=sql
-    )
-
-
-def load_ui_scenario_results_table_metadata(conn):
-    sql = """
-        INSERT INTO ui_scenario_results_table_metadata
-        (results_table, include, caption)
-        VALUES (?, ?, ?);
-        """
-    load_aux_data(conn=conn, filename="ui_scenario_results_table_metadata.csv", sql=sql)
-
-
-def load_ui_scenario_results_plot_metadata(conn):
-    sql = """
-        INSERT INTO ui_scenario_results_plot_metadata
-        (results_plot, include, caption, load_zone_form_control,
-        energy_target_zone_form_control, carbon_cap_zone_form_control,
-        period_form_control, horizon_form_control,
-        start_timepoint_form_control, end_timepoint_form_control,
-        stage_form_control, project_form_control, commit_project_form_control)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """
-    load_aux_data(conn=conn, filename="ui_scenario_results_plot_metadata.csv", sql=sql)
-
-
-def load_viz_technologies(conn):
-    sql = """
-        INSERT INTO viz_technologies
-        (technology, color, plotting_order)
-        VALUES (?, ?, ?);"""
-    load_aux_data(conn=conn, filename="viz_technologies.csv", sql=sql)
-
-
-def load_aux_data(conn, filename, sql):
+def load_aux_data(conn, table, columns):
     """
     :param conn:
-    :param filename:
-    :param sql:
+    :param table: the database table to insert into; the data are read from
+        the CSV file with the same name in the data directory
+    :param columns: the table columns, in the same order as in the CSV file
     :return:
 
     """
-    data = []
     cursor = conn.cursor()
 
-    file_path = os.path.join(os.path.dirname(__file__), "data", filename)
-    with open(file_path, "r") as f:
+    sql = """
+        INSERT INTO {}
+        ({})
+        VALUES ({});""".format(
+        table, ", ".join(columns), ", ".join(["?"] * len(columns))
+    )
+
+    file_path = os.path.join(DATA_DIRECTORY, table + ".csv")
+    # Some of the CSV files start with a UTF-8 byte order mark, so we can't
+    # use the ASCII codec; newline="" leaves newline handling to the csv
+    # module
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
         reader = csv.reader(f, delimiter=",")
         next(reader)
-        for row in reader:
-            data.append(tuple([row[i] for i in range(len(row))]))
+        # The reader already yields one list of values per row, which
+        # executemany can bind directly
+        data = list(reader)
 
-    spin_on_database_lock(conn=conn, cursor=cursor, sql=sql, data=data)
+    spin_on_database_lock(conn=conn, cursor=cursor, sql=sql, data=data, commit=False)
 
 
 def main(args=None):
@@ -480,9 +381,23 @@ def main(args=None):
             sys.exit()
 
     # Connect to the database
-    conn = sqlite3.connect(database=db_path)
-    # Allow concurrent reading and writing
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = sqlite3.connect(database=db_path, cached_statements=256)
+    # Use larger pages; this must be set before anything is written to the
+    # new database file (including the switch to WAL mode below)
+    conn.execute("PRAGMA page_size=8192")
+    # Nothing else should access the database while we create it, so hold
+    # the lock for the whole connection instead of acquiring and
+    # releasing it for each transaction
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    # Allow concurrent reading and writing (not applicable to in-memory
+    # databases)
+    if not parsed_args.in_memory:
+        conn.execute("PRAGMA journal_mode=WAL")
+    # Relax syncing and keep temporary data in memory to speed up the
+    # schema creation and data loading
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
     # Enforce foreign keys (default = not enforced)
     conn.execute("PRAGMA foreign_keys=ON;")
     # Create schema
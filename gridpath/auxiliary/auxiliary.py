@@ -174,6 +174,24 @@ def cursor_to_df(cursor):
     return df
 
 
+def write_tab_file(cursor, file_path, columns):
+    """
+    Write the query results in the cursor to a tab-delimited model input file.
+    :param cursor: cursor object with query results
+    :param file_path: path of the .tab file to write
+    :param columns: list of str, the column headers, in the same order as the
+        query results
+    :return:
+
+    The values are written as returned by the database (the frame keeps the
+    object dtype, so integer columns with NULLs are not upcast to floats),
+    NULLs are written as ".", and lines always end with "\\n".
+    """
+    df = pd.DataFrame(data=cursor.fetchall(), columns=columns, dtype=object)
+    with open(file_path, "w", newline="", buffering=2**20) as f:
+        df.to_csv(f, sep="\t", index=False, na_rep=".", line_terminator="\n")
+
+
 def check_for_integer_subdirectories(main_directory):
     """
     :param main_directory: directory where we'll look for subdirectories
@@ -60,6 +60,27 @@ class DynamicComponents(object):
     input data.
     """
 
+    # The component containers are fixed, so we don't need a per-instance
+    # __dict__
+    __slots__ = (
+        capacity_type_operational_period_sets,
+        prm_cost_group_sets,
+        prm_cost_group_prm_type,
+        headroom_variables,
+        footroom_variables,
+        reserve_variable_derate_params,
+        reserve_to_energy_adjustment_params,
+        tx_capacity_type_operational_period_sets,
+        load_balance_production_components,
+        load_balance_consumption_components,
+        carbon_cap_balance_emission_components,
+        prm_balance_provision_components,
+        local_capacity_balance_provision_components,
+        fuel_burn_balance_components,
+        cost_components,
+        revenue_components,
+    )
+
     def __init__(self):
         """
         Initialize the dynamic components.
@@ -72,11 +93,11 @@ class DynamicComponents(object):
         # project-operational_period set that includes all projects
         # If called, the capacity-type modules will populate these lists with
         # the name of the respective set for the capacity type
-        setattr(self, capacity_type_operational_period_sets, list())
+        self.capacity_type_operational_period_sets = list()
 
         # PRM cost groups
-        setattr(self, prm_cost_group_sets, list())
-        setattr(self, prm_cost_group_prm_type, dict())
+        self.prm_cost_groups = list()
+        self.prm_cost_group_prm_type = dict()
 
         # ### Operating reserves ### #
         # Headroom and footroom variables
@@ -85,8 +106,8 @@ class DynamicComponents(object):
         # providing any reserves, or will include the names of the
         # respective reserve-provision variable if the reserve-type is
         # modeled and a project can provide it
-        setattr(self, headroom_variables, dict())
-        setattr(self, footroom_variables, dict())
+        self.headroom_variables = dict()
+        self.footroom_variables = dict()
 
         # A reserve-provision derate parameter and a
         # reserve-to-energy-adjustment parameter could also be assigned to
@@ -95,35 +116,35 @@ class DynamicComponents(object):
         # regulation up variable will be linked to a regulation-up
         # parameter, the spinning-reserves variable will be linked to a
         # spinning reserves paramater, etc.)
-        setattr(self, reserve_variable_derate_params, dict())
-        setattr(self, reserve_to_energy_adjustment_params, dict())
+        self.reserve_variable_derate_params = dict()
+        self.reserve_to_energy_adjustment_params = dict()
 
         # ### Transmission sets and variables ### #
-        setattr(self, tx_capacity_type_operational_period_sets, list())
+        self.tx_capacity_type_operational_period_sets = list()
 
         # ### Constraint and objective function components ### #
         # Load balance constraint
         # Modules will add component names to these lists
-        setattr(self, load_balance_production_components, list())
-        setattr(self, load_balance_consumption_components, list())
+        self.load_balance_production_components = list()
+        self.load_balance_consumption_components = list()
 
         # Carbon cap constraint
         # Modules will add component names to these lists
-        setattr(self, carbon_cap_balance_emission_components, list())
+        self.carbon_cap_balance_emission_components = list()
 
         # PRM constraint
         # Modules will add component names to this list
-        setattr(self, prm_balance_provision_components, list())
+        self.prm_balance_provision_components = list()
 
         # Local capacity constraint
         # Modules will add component names to this list
-        setattr(self, local_capacity_balance_provision_components, list())
+        self.local_capacity_balance_provision_components = list()
 
         # Fuel burn limit constraint
         # Modules will add component names to this list
-        setattr(self, fuel_burn_balance_components, list())
+        self.fuel_burn_balance_components = list()
 
         # Objective functions
         # Modules will add component names to this list
-        setattr(self, cost_components, list())
-        setattr(self, revenue_components, list())
+        self.cost_components = list()
+        self.revenue_components = list()
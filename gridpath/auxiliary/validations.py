@@ -23,6 +23,11 @@ import pandas as pd
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import cursor_to_df
 
+# The (column name, datatype category) pairs of the database tables looked up
+# during a validation run, keyed by (database file, table); validate_inputs
+# clears this at the end of each run
+_table_dtypes_cache = dict()
+
 
 def _get_idx_col(df):
     if "project" in df.columns:
@@ -64,9 +69,39 @@ def write_validation_to_database(
     :return:
     """
 
-    # If there are no validation errors to write, simply exit here
-    if not errors:
-        return False
+    return write_validations_to_database(
+        conn=conn,
+        scenario_id=scenario_id,
+        subproblem_id=subproblem_id,
+        stage_id=stage_id,
+        gridpath_module=gridpath_module,
+        validations=[(db_table, severity, errors)],
+    )
+
+
+def write_validations_to_database(
+    conn,
+    scenario_id,
+    subproblem_id,
+    stage_id,
+    gridpath_module,
+    validations,
+):
+    """
+    Write the validation errors of several checks and the associated
+    meta-data to the status_validation database table with a single insert
+    statement and commit.
+
+    :param conn: The database connection
+    :param scenario_id: The scenario ID of the scenario that is being validated
+    :param subproblem_id: The active subproblem ID that is being validated
+    :param stage_id: The active stage ID that is being validated
+    :param gridpath_module: The gridpath_module that performed the validation
+    :param validations: list of (db_table, severity, errors) tuples, with
+    errors the list of validation errors found by a check, each error a
+    string describing the issue.
+    :return:
+    """
 
     # add timestamp (ISO8601 strings, so truncate to ms)
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
@@ -81,8 +116,14 @@ def write_validation_to_database(
             error,
             timestamp,
         )
+        for (db_table, severity, errors) in validations
         for error in errors
     ]
+
+    # If there are no validation errors to write, simply exit here
+    if not rows:
+        return False
+
     c = conn.cursor()
     sql = """
     INSERT INTO status_validation
@@ -109,6 +150,39 @@ def get_expected_dtypes(conn, tables):
         ('numeric' or 'string')
     """
 
+    # The validation of each module looks up the same tables, so cache the
+    # datatypes of tables in database files for the rest of the run
+    db_file = conn.execute("""PRAGMA database_list""").fetchone()[2]
+
+    expected_dtypes = {}
+    for table in tables:
+        if not db_file:
+            expected_dtypes.update(_get_table_dtypes(conn, table))
+        else:
+            if (db_file, table) not in _table_dtypes_cache:
+                _table_dtypes_cache[db_file, table] = _get_table_dtypes(conn, table)
+            expected_dtypes.update(_table_dtypes_cache[db_file, table])
+
+    return expected_dtypes
+
+
+def clear_table_dtypes_cache():
+    """
+    Clear the table datatypes cached by get_expected_dtypes, e.g. at the end
+    of a validation run.
+    """
+    _table_dtypes_cache.clear()
+
+
+def _get_table_dtypes(conn, table):
+    """
+    Get the (column name, expected datatype category) pairs of a database
+    table.
+    :param conn: database connection
+    :param table: database table for which to collect datatypes
+    :return: tuple of (column name, datatype category) tuples
+    """
+
     # Map SQLITE types to either numeric or string
     # Based on '3.1 Determination of column affinity':
     # https://www.sqlite.org/datatype3.html
@@ -136,17 +210,12 @@ def get_expected_dtypes(conn, tables):
                 "Encountered unknown SQLite type: type {}".format(detailed_type)
             )
 
-    expected_dtypes = {}
-    for table in tables:
-        # Get the expected datatypes from the table info (pragma)
-        table_info = conn.execute("""PRAGMA table_info({})""".format(table))
-        df = cursor_to_df(table_info)
+    # Get the expected datatypes from the table info (pragma)
+    table_info = conn.execute("""PRAGMA table_info({})""".format(table))
+    df = cursor_to_df(table_info)
 
-        df["type_category"] = df["type"].map(get_type_category)
-        dtypes_dict = dict(zip(df.name, df.type_category))
-        expected_dtypes.update(dtypes_dict)
-
-    return expected_dtypes
+    df["type_category"] = df["type"].map(get_type_category)
+    return tuple(zip(df.name, df.type_category))
 
 
 def get_projects_by_reserve(scenario_id, subscenarios, conn):
@@ -290,8 +359,9 @@ def validate_dtypes(df, expected_dtypes):
     """
     result = []
     columns = []
+    all_missing = df.isna().all(axis=0)
     for column in df.columns:
-        if pd.isna(df[column]).all():
+        if all_missing[column]:
             pass
         elif expected_dtypes[column] == "numeric" and not pd.api.types.is_numeric_dtype(
             df[column]
@@ -340,22 +410,25 @@ def validate_values(
     """
 
     result = []
-    cols = [col] if isinstance(col, str) else col
-    for c in cols:
-        min_invalids = (df[c] <= min) if strict_min else (df[c] < min)
-        max_invalids = (df[c] >= max) if strict_max else (df[c] > max)
-        invalids = min_invalids | max_invalids
-        if invalids.any():
-            bad_idxs = df[idx_col][invalids].astype(str).values
-            print_bad_idxs = ", ".join(bad_idxs)
-            exp_min = "{} <".format(min) if strict_min else "{} <=".format(min)
-            exp_max = "< {}".format(max) if strict_max else "<= {}".format(max)
+    cols = [col] if isinstance(col, str) else list(col)
+
+    # Check all columns in a single comparison and only build error messages
+    # for the columns with invalid values (missing values are never invalid)
+    values = df[cols].to_numpy(dtype=float)
+    min_invalids = (values <= min) if strict_min else (values < min)
+    max_invalids = (values >= max) if strict_max else (values > max)
+    invalids = min_invalids | max_invalids
+    for i in np.flatnonzero(invalids.any(axis=0)):
+        bad_idxs = df[idx_col][invalids[:, i]].astype(str).values
+        print_bad_idxs = ", ".join(bad_idxs)
+        exp_min = "{} <".format(min) if strict_min else "{} <=".format(min)
+        exp_max = "< {}".format(max) if strict_max else "<= {}".format(max)
 
-            result.append(
-                "{}(s) '{}': Expected {} '{}' {}".format(
-                    idx_col, print_bad_idxs, exp_min, c, exp_max
-                )
+        result.append(
+            "{}(s) '{}': Expected {} '{}' {}".format(
+                idx_col, print_bad_idxs, exp_min, cols[i], exp_max
             )
+        )
 
     return result
 
@@ -572,16 +645,26 @@ def validate_row_monotonicity(
 
     cols = [col] if isinstance(col, str) else col
     for c in cols:
-        df2 = df.dropna(subset=[c])
-        group = df2.sort_values([idx_col, rank_col]).groupby(idx_col)[c]
+        df2 = df.dropna(subset=[c]).sort_values([idx_col, rank_col])
+        # An index is monotonic if none of the differences between its
+        # consecutive rows goes in the wrong direction; differences across
+        # two indexes (or with a missing index, coded -1) are ignored
+        codes, _ = pd.factorize(df2[idx_col])
+        same_idx = (codes[1:] == codes[:-1]) & (codes[1:] >= 0)
+        # Non-numeric values (already flagged by the dtype validation) can't
+        # be ordered, so the differences they are part of are invalid
+        values = pd.to_numeric(df2[c], errors="coerce").to_numpy(dtype=float)
+        diffs = np.diff(values)
+        non_numeric = np.isnan(values)
+        unordered = non_numeric[1:] | non_numeric[:-1]
         if increasing:
-            invalids = ~group.apply(lambda x: x.is_monotonic)
+            invalids = same_idx & ((diffs < 0) | unordered)
             direction = "increase"
         else:
-            invalids = ~group.apply(lambda x: x.is_monotonic_decreasing)
+            invalids = same_idx & ((diffs > 0) | unordered)
             direction = "decrease"
         if invalids.any():
-            bad_idxs = invalids.index[invalids]
+            bad_idxs = pd.unique(df2[idx_col].to_numpy()[1:][invalids])
             print_bad_idxs = ", ".join(bad_idxs)
             results.append(
                 "{}(s) '{}': {} should monotonically {} with {}. {}".format(
@@ -605,7 +688,11 @@ def validate_column_monotonicity(df, cols, idx_col="project", msg=""):
     results = []
 
     df = df.dropna(subset=cols)
-    invalids = ~df[cols].apply(lambda x: x.is_monotonic, axis=1)
+    # A row is invalid if a value is lower than the one in the previous column
+    # or if it has non-numeric values (already flagged by the dtype
+    # validation), which can't be ordered
+    values = df[cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    invalids = (np.diff(values, axis=1) < 0).any(axis=1) | np.isnan(values).any(axis=1)
     if invalids.any():
         bad_idxs = df[idx_col][invalids].values
         results.append(
@@ -0,0 +1,58 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+
+
+def load_balancing_area_data(
+    data_portal, file_path, bas_set, allow_violation_param, violation_penalty_param
+):
+    """
+    Load the balancing areas and their violation parameters from a
+    balancing areas .tab file.
+    :param data_portal: the data portal to load the data into
+    :param file_path: path of the .tab file with the balancing_area,
+        allow_violation, and violation_penalty_per_mw columns
+    :param bas_set: str, the name of the balancing area set
+    :param allow_violation_param: str, the name of the allow-violation param
+    :param violation_penalty_param: str, the name of the violation penalty param
+    :return:
+
+    The file is read once with pandas and the data are passed to the data
+    portal directly. Missing values (".") are left uninitialized as with
+    data_portal.load; other strings such as "NA" are kept as they are.
+    """
+    df = pd.read_csv(
+        file_path,
+        sep="\t",
+        usecols=["balancing_area", "allow_violation", "violation_penalty_per_mw"],
+        na_values=".",
+        keep_default_na=False,
+    )
+
+    # data() requires the default namespace, which only exists once some
+    # data have been loaded into the data portal
+    if None not in data_portal.namespaces():
+        data_portal[bas_set] = {None: []}
+    data_portal.data()[bas_set] = {None: df["balancing_area"].tolist()}
+    data_portal.data()[allow_violation_param] = {
+        ba: int(v)
+        for (ba, v) in zip(df["balancing_area"], df["allow_violation"])
+        if not pd.isna(v)
+    }
+    data_portal.data()[violation_penalty_param] = {
+        ba: float(v)
+        for (ba, v) in zip(df["balancing_area"], df["violation_penalty_per_mw"])
+        if not pd.isna(v)
+    }
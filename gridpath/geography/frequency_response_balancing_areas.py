@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import os.path
 from pyomo.environ import Set, Param, Boolean, NonNegativeReals
 
+from gridpath.auxiliary.auxiliary import write_tab_file
+from gridpath.geography.common_functions import load_balancing_area_data
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -45,20 +47,18 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     :param stage:
     :return:
     """
-    data_portal.load(
-        filename=os.path.join(
+    load_balancing_area_data(
+        data_portal=data_portal,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "frequency_response_balancing_areas.tab",
         ),
-        select=("balancing_area", "allow_violation", "violation_penalty_per_mw"),
-        index=m.FREQUENCY_RESPONSE_BAS,
-        param=(
-            m.frequency_response_allow_violation,
-            m.frequency_response_violation_penalty_per_mw,
-        ),
+        bas_set="FREQUENCY_RESPONSE_BAS",
+        allow_violation_param="frequency_response_allow_violation",
+        violation_penalty_param="frequency_response_violation_penalty_per_mw",
     )
 
 
@@ -77,9 +77,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         """SELECT frequency_response_ba, allow_violation,
            violation_penalty_per_mw, reserve_to_energy_adjustment
            FROM inputs_geography_frequency_response_bas
-           WHERE frequency_response_ba_scenario_id = {};""".format(
-            subscenarios.FREQUENCY_RESPONSE_BA_SCENARIO_ID
-        )
+           WHERE frequency_response_ba_scenario_id = ?;""",
+        (subscenarios.FREQUENCY_RESPONSE_BA_SCENARIO_ID,),
     )
 
     return freq_resp_bas
@@ -118,29 +117,19 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=freq_resp_bas,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "frequency_response_balancing_areas.tab",
         ),
-        "w",
-        newline="",
-    ) as freq_resp_bas_tab_file:
-        writer = csv.writer(freq_resp_bas_tab_file, delimiter="\t", lineterminator="\n")
-
-        # Write header
-        writer.writerow(
-            [
-                "balancing_area",
-                "allow_violation",
-                "violation_penalty_per_mw",
-                "reserve_to_energy_adjustment",
-            ]
-        )
-
-        for row in freq_resp_bas:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "balancing_area",
+            "allow_violation",
+            "violation_penalty_per_mw",
+            "reserve_to_energy_adjustment",
+        ],
+    )
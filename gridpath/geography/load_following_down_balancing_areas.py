@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import os.path
 from pyomo.environ import Set, Param, Boolean, NonNegativeReals
 
+from gridpath.auxiliary.auxiliary import write_tab_file
+from gridpath.geography.common_functions import load_balancing_area_data
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -43,20 +45,18 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     :param stage:
     :return:
     """
-    data_portal.load(
-        filename=os.path.join(
+    load_balancing_area_data(
+        data_portal=data_portal,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "load_following_down_balancing_areas.tab",
         ),
-        select=("balancing_area", "allow_violation", "violation_penalty_per_mw"),
-        index=m.LF_RESERVES_DOWN_ZONES,
-        param=(
-            m.lf_reserves_down_allow_violation,
-            m.lf_reserves_down_violation_penalty_per_mw,
-        ),
+        bas_set="LF_RESERVES_DOWN_ZONES",
+        allow_violation_param="lf_reserves_down_allow_violation",
+        violation_penalty_param="lf_reserves_down_violation_penalty_per_mw",
     )
 
 
@@ -75,9 +75,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         """SELECT lf_reserves_down_ba, allow_violation,
                violation_penalty_per_mw, reserve_to_energy_adjustment
                FROM inputs_geography_lf_reserves_down_bas
-               WHERE lf_reserves_down_ba_scenario_id = {};""".format(
-            subscenarios.LF_RESERVES_DOWN_BA_SCENARIO_ID
-        )
+               WHERE lf_reserves_down_ba_scenario_id = ?;""",
+        (subscenarios.LF_RESERVES_DOWN_BA_SCENARIO_ID,),
     )
 
     return lf_down_bas
@@ -116,29 +115,19 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=lf_down_bas,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "load_following_down_balancing_areas.tab",
         ),
-        "w",
-        newline="",
-    ) as lf_down_bas_tab_file:
-        writer = csv.writer(lf_down_bas_tab_file, delimiter="\t", lineterminator="\n")
-
-        # Write header
-        writer.writerow(
-            [
-                "balancing_area",
-                "allow_violation",
-                "violation_penalty_per_mw",
-                "reserve_to_energy_adjustment",
-            ]
-        )
-
-        for row in lf_down_bas:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "balancing_area",
+            "allow_violation",
+            "violation_penalty_per_mw",
+            "reserve_to_energy_adjustment",
+        ],
+    )
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import os.path
 from pyomo.environ import Set, Param, Boolean, NonNegativeReals
 
+from gridpath.auxiliary.auxiliary import write_tab_file
+from gridpath.geography.common_functions import load_balancing_area_data
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -43,20 +45,18 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     :param stage:
     :return:
     """
-    data_portal.load(
-        filename=os.path.join(
+    load_balancing_area_data(
+        data_portal=data_portal,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "regulation_up_balancing_areas.tab",
         ),
-        select=("balancing_area", "allow_violation", "violation_penalty_per_mw"),
-        index=m.REGULATION_UP_ZONES,
-        param=(
-            m.regulation_up_allow_violation,
-            m.regulation_up_violation_penalty_per_mw,
-        ),
+        bas_set="REGULATION_UP_ZONES",
+        allow_violation_param="regulation_up_allow_violation",
+        violation_penalty_param="regulation_up_violation_penalty_per_mw",
     )
 
 
@@ -75,9 +75,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         """SELECT regulation_up_ba, allow_violation,
            violation_penalty_per_mw, reserve_to_energy_adjustment
            FROM inputs_geography_regulation_up_bas
-           WHERE regulation_up_ba_scenario_id = {};""".format(
-            subscenarios.REGULATION_UP_BA_SCENARIO_ID
-        )
+           WHERE regulation_up_ba_scenario_id = ?;""",
+        (subscenarios.REGULATION_UP_BA_SCENARIO_ID,),
     )
     return reg_up_bas
 
@@ -115,29 +114,19 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=reg_up_bas,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "regulation_up_balancing_areas.tab",
         ),
-        "w",
-        newline="",
-    ) as reg_up_bas_tab_file:
-        writer = csv.writer(reg_up_bas_tab_file, delimiter="\t", lineterminator="\n")
-
-        # Write header
-        writer.writerow(
-            [
-                "balancing_area",
-                "allow_violation",
-                "violation_penalty_per_mw",
-                "reserve_to_energy_adjustment",
-            ]
-        )
-
-        for row in reg_up_bas:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "balancing_area",
+            "allow_violation",
+            "violation_penalty_per_mw",
+            "reserve_to_energy_adjustment",
+        ],
+    )
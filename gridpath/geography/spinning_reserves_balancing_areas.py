@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import os.path
 from pyomo.environ import Set, Param, Boolean, NonNegativeReals
 
+from gridpath.auxiliary.auxiliary import write_tab_file
+from gridpath.geography.common_functions import load_balancing_area_data
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -45,20 +47,18 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     :param stage:
     :return:
     """
-    data_portal.load(
-        filename=os.path.join(
+    load_balancing_area_data(
+        data_portal=data_portal,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "spinning_reserves_balancing_areas.tab",
         ),
-        select=("balancing_area", "allow_violation", "violation_penalty_per_mw"),
-        index=m.SPINNING_RESERVES_ZONES,
-        param=(
-            m.spinning_reserves_allow_violation,
-            m.spinning_reserves_violation_penalty_per_mw,
-        ),
+        bas_set="SPINNING_RESERVES_ZONES",
+        allow_violation_param="spinning_reserves_allow_violation",
+        violation_penalty_param="spinning_reserves_violation_penalty_per_mw",
     )
 
 
@@ -77,9 +77,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         """SELECT spinning_reserves_ba, allow_violation,
            violation_penalty_per_mw, reserve_to_energy_adjustment
            FROM inputs_geography_spinning_reserves_bas
-           WHERE spinning_reserves_ba_scenario_id = {};""".format(
-            subscenarios.SPINNING_RESERVES_BA_SCENARIO_ID
-        )
+           WHERE spinning_reserves_ba_scenario_id = ?;""",
+        (subscenarios.SPINNING_RESERVES_BA_SCENARIO_ID,),
     )
 
     return spinning_reserves_bas
@@ -118,31 +117,19 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=spinning_reserves_bas,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "spinning_reserves_balancing_areas.tab",
         ),
-        "w",
-        newline="",
-    ) as spinning_reserve_bas_tab_file:
-        writer = csv.writer(
-            spinning_reserve_bas_tab_file, delimiter="\t", lineterminator="\n"
-        )
-
-        # Write header
-        writer.writerow(
-            [
-                "balancing_area",
-                "allow_violation",
-                "violation_penalty_per_mw",
-                "reserve_to_energy_adjustment",
-            ]
-        )
-
-        for row in spinning_reserves_bas:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "balancing_area",
+            "allow_violation",
+            "violation_penalty_per_mw",
+            "reserve_to_energy_adjustment",
+        ],
+    )
@@ -74,6 +74,33 @@ def operational_periods_by_project_vintage(
     return operational_periods
 
 
+def operational_periods_by_vintage_and_lifetime(period_years, vintage, lifetime_yrs):
+    """
+    :param period_years: tuple of (period, start year, end year) tuples for
+        the study periods
+    :param vintage: the project vintage
+    :param lifetime_yrs: the project-vintage lifetime
+    :return: tuple of the operational periods given the study periods and
+        the vintage and lifetime
+
+    Version of operational_periods_by_project_vintage for callers that
+    already have the period data as (period, start year, end year) tuples.
+    The operational periods only depend on the study periods, the vintage,
+    and the lifetime, so callers can compute them once for each vintage and
+    lifetime combination and reuse them for all project-vintages with the
+    same vintage and lifetime.
+    """
+    return tuple(
+        operational_periods_by_project_vintage(
+            periods=[p for (p, start, end) in period_years],
+            period_start_year={p: start for (p, start, end) in period_years},
+            period_end_year={p: end for (p, start, end) in period_years},
+            vintage=vintage,
+            lifetime_yrs=lifetime_yrs,
+        )
+    )
+
+
 def project_operational_periods(
     project_vintages_set, operational_periods_by_project_vintage_set
 ):
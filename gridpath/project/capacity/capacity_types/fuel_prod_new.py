@@ -23,10 +23,6 @@ Like with new-build generation, capacity costs added to the objective
 function include the annualized capital cost and the annual fixed O&M cost.
 """
 
-from __future__ import print_function
-
-from builtins import next
-from builtins import zip
 import csv
 import os.path
 import pandas as pd
@@ -36,13 +32,13 @@ from pyomo.environ import (
     Var,
     Expression,
     NonNegativeReals,
-    value,
+    quicksum,
 )
 
-from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.auxiliary import cursor_to_df, write_tab_file
 from gridpath.auxiliary.dynamic_components import capacity_type_operational_period_sets
 from gridpath.auxiliary.validations import (
-    write_validation_to_database,
+    write_validations_to_database,
     validate_values,
     get_expected_dtypes,
     get_projects,
@@ -50,9 +46,8 @@ from gridpath.auxiliary.validations import (
     validate_idxs,
 )
 from gridpath.project.capacity.capacity_types.common_methods import (
-    operational_periods_by_project_vintage,
+    operational_periods_by_vintage_and_lifetime,
     project_operational_periods,
-    project_vintages_operational_in_period,
     update_capacity_results_table,
 )
 
@@ -281,14 +276,65 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 ###############################################################################
 
 
+def vintage_lookups(mod):
+    """
+    :param mod: the model instance
+    :return: dictionary with the operational periods of each project-vintage
+        ('opr_prds_by_vnt'), the project-vintages operational in each period
+        ('opr_vnts_by_prd'), the vintages of each project that are
+        operational in each period ('opr_vnts_by_prd_prj', keyed by
+        (period, project)), and the (production, release, storage) capacity
+        costs of each project-vintage ('costs_by_vnt')
+
+    The lookups are built in a single pass over FUEL_PROD_NEW_VNTS the first
+    time they are needed and are then stored on the model instance, so that
+    the derived set and expression rules can look them up directly.
+    """
+    lookups = getattr(mod, "_fuel_prod_new_vintage_lookups", None)
+    if lookups is None:
+        # Look up the period start and end years once instead of for every
+        # project-vintage
+        period_years = tuple(
+            (p, mod.period_start_year[p], mod.period_end_year[p]) for p in mod.PERIODS
+        )
+
+        lookups = {
+            "opr_prds_by_vnt": dict(),
+            "opr_vnts_by_prd": dict(),
+            "opr_vnts_by_prd_prj": dict(),
+            "costs_by_vnt": dict(),
+        }
+        # The operational periods only depend on the vintage and the
+        # lifetime, so compute them once for each combination
+        opr_prds_by_vnt_lifetime = dict()
+        for (prj, v) in mod.FUEL_PROD_NEW_VNTS:
+            lookups["costs_by_vnt"][prj, v] = (
+                mod.fuel_prod_new_prod_cost_fuelunitperhour_yr[prj, v],
+                mod.fuel_prod_new_release_cost_fuelunitperhour_yr[prj, v],
+                mod.fuel_prod_new_storage_cost_fuelunit_yr[prj, v],
+            )
+            lifetime_yrs = mod.fuel_prod_new_lifetime_yrs[prj, v]
+            if (v, lifetime_yrs) not in opr_prds_by_vnt_lifetime:
+                opr_prds_by_vnt_lifetime[
+                    v, lifetime_yrs
+                ] = operational_periods_by_vintage_and_lifetime(
+                    period_years=period_years,
+                    vintage=v,
+                    lifetime_yrs=lifetime_yrs,
+                )
+            opr_prds = opr_prds_by_vnt_lifetime[v, lifetime_yrs]
+            lookups["opr_prds_by_vnt"][prj, v] = opr_prds
+            for prd in opr_prds:
+                lookups["opr_vnts_by_prd"].setdefault(prd, []).append((prj, v))
+                lookups["opr_vnts_by_prd_prj"].setdefault((prd, prj), []).append(v)
+
+        mod._fuel_prod_new_vintage_lookups = lookups
+
+    return lookups
+
+
 def operational_periods_by_vintage(mod, prj, v):
-    return operational_periods_by_project_vintage(
-        periods=getattr(mod, "PERIODS"),
-        period_start_year=getattr(mod, "period_start_year"),
-        period_end_year=getattr(mod, "period_end_year"),
-        vintage=v,
-        lifetime_yrs=mod.fuel_prod_new_lifetime_yrs[prj, v],
-    )
+    return vintage_lookups(mod)["opr_prds_by_vnt"][prj, v]
 
 
 def fuel_prod_new_operational_periods(mod):
@@ -299,17 +345,30 @@ def fuel_prod_new_operational_periods(mod):
 
 
 def fuel_prod_new_vintages_operational_in_period(mod, p):
-    return project_vintages_operational_in_period(
-        project_vintage_set=mod.FUEL_PROD_NEW_VNTS,
-        operational_periods_by_project_vintage_set=mod.OPR_PRDS_BY_FUEL_PROD_NEW_VINTAGE,
-        period=p,
-    )
+    return vintage_lookups(mod)["opr_vnts_by_prd"].get(p, [])
 
 
 # Expression Rules
 ###############################################################################
 
 
+def sum_build_over_operational_vintages(mod, build_var, prj, prd):
+    """
+    :param mod: the model instance
+    :param build_var: the capacity-build variable, indexed by project-vintage
+    :param prj: the project
+    :param prd: the period
+    :return: the sum of the capacity-build of all vintages of the project
+        that are operational in the period
+
+    The production, release, and storage capacity expressions all use the
+    same list of vintages operational in the period.
+    """
+    return quicksum(
+        build_var[prj, v] for v in vintage_lookups(mod)["opr_vnts_by_prd_prj"][prd, prj]
+    )
+
+
 def prod_cap_rule(mod, prj, prd):
     """
     **Expression Name**: FuelProdNew_Prod_Capacity_FuelUnitPerHour
@@ -326,10 +385,11 @@ def prod_cap_rule(mod, prj, prd):
     capacity-build only, and in 2050, the capacity would be undefined (i.e.
     0 for the purposes of the objective function).
     """
-    return sum(
-        mod.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour[prj, v]
-        for (project, v) in mod.FUEL_PROD_NEW_VNTS_OPR_IN_PRD[prd]
-        if project == prj
+    return sum_build_over_operational_vintages(
+        mod=mod,
+        build_var=mod.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour,
+        prj=prj,
+        prd=prd,
     )
 
 
@@ -349,10 +409,11 @@ def rel_cap_rule(mod, prj, prd):
     capacity-build only, and in 2050, the capacity would be undefined (i.e.
     0 for the purposes of the objective function).
     """
-    return sum(
-        mod.FuelProdNew_Build_Rel_Cap_FuelUnitPerHour[prj, v]
-        for (project, v) in mod.FUEL_PROD_NEW_VNTS_OPR_IN_PRD[prd]
-        if project == prj
+    return sum_build_over_operational_vintages(
+        mod=mod,
+        build_var=mod.FuelProdNew_Build_Rel_Cap_FuelUnitPerHour,
+        prj=prj,
+        prd=prd,
     )
 
 
@@ -371,10 +432,11 @@ def storage_rule(mod, prj, prd):
     we'd take 2030 energy-build only, and in 2050, the energy would be undefined (i.e.
     0 for the purposes of the objective function).
     """
-    return sum(
-        mod.FuelProdNew_Build_Stor_Cap_FuelUnitPerHour[project, v]
-        for (project, v) in mod.FUEL_PROD_NEW_VNTS_OPR_IN_PRD[prd]
-        if project == prj
+    return sum_build_over_operational_vintages(
+        mod=mod,
+        build_var=mod.FuelProdNew_Build_Stor_Cap_FuelUnitPerHour,
+        prj=prj,
+        prd=prd,
     )
 
 
@@ -408,18 +470,21 @@ def capacity_cost_rule(mod, prj, prd):
     annualized energy cost for that vintage, summed over all vintages
     operational in the period. Note that power and energy costs are additive.
     """
-    return sum(
-        (
-            mod.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour[prj, v]
-            * mod.fuel_prod_new_prod_cost_fuelunitperhour_yr[prj, v]
-            + mod.FuelProdNew_Build_Rel_Cap_FuelUnitPerHour[prj, v]
-            * mod.fuel_prod_new_release_cost_fuelunitperhour_yr[prj, v]
-            + mod.FuelProdNew_Build_Stor_Cap_FuelUnitPerHour[prj, v]
-            * mod.fuel_prod_new_storage_cost_fuelunit_yr[prj, v]
+    build_prod = mod.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour
+    build_rel = mod.FuelProdNew_Build_Rel_Cap_FuelUnitPerHour
+    build_stor = mod.FuelProdNew_Build_Stor_Cap_FuelUnitPerHour
+
+    lookups = vintage_lookups(mod)
+    terms = list()
+    for v in lookups["opr_vnts_by_prd_prj"][prd, prj]:
+        prod_cost, rel_cost, stor_cost = lookups["costs_by_vnt"][prj, v]
+        terms.append(
+            build_prod[prj, v] * prod_cost
+            + build_rel[prj, v] * rel_cost
+            + build_stor[prj, v] * stor_cost
         )
-        for (project, v) in mod.FUEL_PROD_NEW_VNTS_OPR_IN_PRD[prd]
-        if project == prj
-    )
+
+    return quicksum(terms)
 
 
 # Input-Output
@@ -436,8 +501,6 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     :param stage:
     :return:
     """
-    fuel_prod_new_projects = list()
-
     _df = pd.read_csv(
         os.path.join(
             scenario_directory,
@@ -451,35 +514,53 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
             "project",
             "capacity_type",
         ],
+        keep_default_na=False,
+    )
+    fuel_prod_new_projects = (
+        _df["project"]
+        .to_numpy()[_df["capacity_type"].to_numpy() == "fuel_prod_new"]
+        .tolist()
     )
-    for r in zip(
-        _df["project"],
-        _df["capacity_type"],
-    ):
-        if r[1] == "fuel_prod_new":
-            fuel_prod_new_projects.append(r[0])
-        else:
-            pass
 
     data_portal.data()["FUEL_PROD_NEW"] = {None: fuel_prod_new_projects}
 
-    data_portal.load(
-        filename=os.path.join(
+    # Read the vintage costs once with pandas and pass the data to the data
+    # portal directly; missing values (".") are left uninitialized as with
+    # data_portal.load, while other strings (e.g. "NA") are kept as they are
+    df = pd.read_csv(
+        os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "fuel_prod_new_vintage_costs.tab",
         ),
-        index=m.FUEL_PROD_NEW_VNTS,
-        param=(
-            m.fuel_prod_new_lifetime_yrs,
-            m.fuel_prod_new_prod_cost_fuelunitperhour_yr,
-            m.fuel_prod_new_release_cost_fuelunitperhour_yr,
-            m.fuel_prod_new_storage_cost_fuelunit_yr,
-        ),
+        sep="\t",
+        na_values=".",
+        keep_default_na=False,
     )
 
+    vintages = list(zip(df["project"], df["vintage"].tolist()))
+    data_portal.data()["FUEL_PROD_NEW_VNTS"] = {None: vintages}
+    for param, column in [
+        ("fuel_prod_new_lifetime_yrs", "lifetime_yrs"),
+        (
+            "fuel_prod_new_prod_cost_fuelunitperhour_yr",
+            "fuel_production_capacity_cost_per_fuelunitperhour_yr",
+        ),
+        (
+            "fuel_prod_new_release_cost_fuelunitperhour_yr",
+            "fuel_release_capacity_cost_per_fuelunitperhour_yr",
+        ),
+        (
+            "fuel_prod_new_storage_cost_fuelunit_yr",
+            "fuel_storage_capacity_cost_per_fuelunit_yr",
+        ),
+    ]:
+        data_portal.data()[param] = {
+            idx: float(v) for (idx, v) in zip(vintages, df[column]) if not pd.isna(v)
+        }
+
 
 def export_results(scenario_directory, subproblem, stage, m, d):
     """
@@ -514,18 +595,23 @@ def export_results(scenario_directory, subproblem, stage, m, d):
                 "new_fuel_stor_capacity_fuelunitperhour",
             ]
         )
-        for (prj, v) in m.FUEL_PROD_NEW_VNTS:
-            writer.writerow(
-                [
-                    prj,
-                    v,
-                    m.technology[prj],
-                    m.load_zone[prj],
-                    value(m.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour[prj, v]),
-                    value(m.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour[prj, v]),
-                    value(m.FuelProdNew_Build_Stor_Cap_FuelUnitPerHour[prj, v]),
-                ]
-            )
+        build_prod = m.FuelProdNew_Build_Prod_Cap_FuelUnitPerHour
+        build_rel = m.FuelProdNew_Build_Rel_Cap_FuelUnitPerHour
+        build_stor = m.FuelProdNew_Build_Stor_Cap_FuelUnitPerHour
+        technology = m.technology
+        load_zone = m.load_zone
+        writer.writerows(
+            [
+                prj,
+                v,
+                technology[prj],
+                load_zone[prj],
+                build_prod[prj, v].value,
+                build_rel[prj, v].value,
+                build_stor[prj, v].value,
+            ]
+            for (prj, v) in m.FUEL_PROD_NEW_VNTS
+        )
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
@@ -538,7 +624,14 @@ def summarize_results(scenario_directory, subproblem, stage, summary_results_fil
     :return:
     """
 
-    # Get the results CSV as dataframe
+    capacity_columns = [
+        "new_fuel_prod_capacity_fuelunitperhour",
+        "new_fuel_rel_capacity_fuelunitperhour",
+        "new_fuel_stor_capacity_fuelunitperhour",
+    ]
+
+    # Get the results CSV as dataframe; only the columns we summarize are
+    # parsed and the load zones and technologies are read as categoricals
     capacity_results_df = pd.read_csv(
         os.path.join(
             scenario_directory,
@@ -546,26 +639,24 @@ def summarize_results(scenario_directory, subproblem, stage, summary_results_fil
             str(stage),
             "results",
             "capacity_fuel_prod_new.csv",
-        )
+        ),
+        usecols=["load_zone", "technology", "vintage"] + capacity_columns,
+        dtype={"load_zone": "category", "technology": "category"},
+    )
+    # With observed=True, pandas does not always sort categorical group keys,
+    # so sort explicitly to keep the summary in load zone/technology/vintage
+    # order
+    capacity_results_agg_df = (
+        capacity_results_df.groupby(
+            by=["load_zone", "technology", "vintage"], as_index=True, observed=True
+        )[capacity_columns]
+        .sum()
+        .sort_index()
     )
-
-    capacity_results_agg_df = capacity_results_df.groupby(
-        by=["load_zone", "technology", "vintage"], as_index=True
-    ).sum()
 
     # Get all technologies with new build production OR release OR energy capacity
     new_build_df = pd.DataFrame(
-        capacity_results_agg_df[
-            (capacity_results_agg_df["new_fuel_prod_capacity_fuelunitperhour"] > 0)
-            | (capacity_results_agg_df["new_fuel_rel_capacity_fuelunitperhour"] > 0)
-            | (capacity_results_agg_df["new_fuel_stor_capacity_fuelunitperhour"] > 0)
-        ][
-            [
-                "new_fuel_prod_capacity_fuelunitperhour",
-                "new_fuel_rel_capacity_fuelunitperhour",
-                "new_fuel_stor_capacity_fuelunitperhour",
-            ]
-        ]
+        capacity_results_agg_df[(capacity_results_agg_df.to_numpy() > 0).any(axis=1)]
     )
 
     # Get the power and energy units from the units.csv file
@@ -609,25 +700,28 @@ def get_model_inputs_from_database(scenario_id, subscenarios, subproblem, stage,
         fuel_production_capacity_cost_per_fuelunitperhour_yr,
         fuel_release_capacity_cost_per_fuelunitperhour_yr,
         fuel_storage_capacity_cost_per_fuelunit_yr
+        FROM
+        (SELECT project
         FROM inputs_project_portfolios
+        WHERE project_portfolio_scenario_id = ?
+        AND capacity_type = 'fuel_prod_new') as portfolio
         CROSS JOIN
         (SELECT period AS vintage
         FROM inputs_temporal_periods
-        WHERE temporal_scenario_id = {temporal_scenario_id}) as relevant_vintages
+        WHERE temporal_scenario_id = ?) as relevant_vintages
         INNER JOIN
         (SELECT project, vintage, lifetime_yrs,
         fuel_production_capacity_cost_per_fuelunitperhour_yr,
         fuel_release_capacity_cost_per_fuelunitperhour_yr,
         fuel_storage_capacity_cost_per_fuelunit_yr
         FROM inputs_project_new_cost
-        WHERE project_new_cost_scenario_id = {project_new_cost_scenario_id}) as cost
-        USING (project, vintage)
-        WHERE project_portfolio_scenario_id = {project_portfolio_scenario_id}
-        AND capacity_type = 'fuel_prod_new';""".format(
-            temporal_scenario_id=subscenarios.TEMPORAL_SCENARIO_ID,
-            project_new_cost_scenario_id=subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
-            project_portfolio_scenario_id=subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        )
+        WHERE project_new_cost_scenario_id = ?) as cost
+        USING (project, vintage);""",
+        (
+            subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
+            subscenarios.TEMPORAL_SCENARIO_ID,
+            subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
+        ),
     )
 
     return costs
@@ -651,34 +745,24 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=costs,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "fuel_prod_new_vintage_costs.tab",
         ),
-        "w",
-        newline="",
-    ) as tab_file:
-        writer = csv.writer(tab_file, delimiter="\t", lineterminator="\n")
-
-        # Write header
-        writer.writerow(
-            [
-                "project",
-                "vintage",
-                "lifetime_yrs",
-                "fuel_production_capacity_cost_per_fuelunitperhour_yr",
-                "fuel_release_capacity_cost_per_fuelunitperhour_yr",
-                "fuel_storage_capacity_cost_per_fuelunit_yr",
-            ]
-        )
-
-        for row in costs:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "project",
+            "vintage",
+            "lifetime_yrs",
+            "fuel_production_capacity_cost_per_fuelunitperhour_yr",
+            "fuel_release_capacity_cost_per_fuelunitperhour_yr",
+            "fuel_storage_capacity_cost_per_fuelunit_yr",
+        ],
+    )
 
 
 def import_results_into_database(
@@ -745,42 +829,28 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
 
     # Check dtypes
     dtype_errors, error_columns = validate_dtypes(cost_df, expected_dtypes)
-    write_validation_to_database(
-        conn=conn,
-        scenario_id=scenario_id,
-        subproblem_id=subproblem,
-        stage_id=stage,
-        gridpath_module=__name__,
-        db_table="inputs_project_new_cost",
-        severity="High",
-        errors=dtype_errors,
-    )
 
     # Check valid numeric columns are non-negative
     numeric_columns = [c for c in cost_df.columns if expected_dtypes[c] == "numeric"]
     valid_numeric_columns = set(numeric_columns) - set(error_columns)
-    write_validation_to_database(
-        conn=conn,
-        scenario_id=scenario_id,
-        subproblem_id=subproblem,
-        stage_id=stage,
-        gridpath_module=__name__,
-        db_table="inputs_project_new_cost",
-        severity="High",
-        errors=validate_values(cost_df, valid_numeric_columns, min=0),
-    )
+    value_errors = validate_values(cost_df, valid_numeric_columns, min=0)
 
     # Check that all binary new build projects are available in >=1 vintage
     msg = "Expected cost data for at least one vintage."
-    write_validation_to_database(
+    idx_errors = validate_idxs(
+        actual_idxs=cost_projects, req_idxs=projects, idx_label="project", msg=msg
+    )
+
+    # Write all validation errors to the database at once
+    write_validations_to_database(
         conn=conn,
         scenario_id=scenario_id,
         subproblem_id=subproblem,
         stage_id=stage,
         gridpath_module=__name__,
-        db_table="inputs_project_new_cost",
-        severity="Mid",
-        errors=validate_idxs(
-            actual_idxs=cost_projects, req_idxs=projects, idx_label="project", msg=msg
-        ),
+        validations=[
+            ("inputs_project_new_cost", "High", dtype_errors),
+            ("inputs_project_new_cost", "High", value_errors),
+            ("inputs_project_new_cost", "Mid", idx_errors),
+        ],
     )
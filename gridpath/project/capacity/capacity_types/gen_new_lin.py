@@ -33,7 +33,6 @@ from __future__ import print_function
 from builtins import next
 from builtins import zip
 
-import csv
 import os.path
 import pandas as pd
 from pyomo.environ import (
@@ -43,13 +42,13 @@ from pyomo.environ import (
     Expression,
     NonNegativeReals,
     Constraint,
-    value,
 )
+from pyomo.core.expr.numeric_expr import LinearExpression
 
-from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.auxiliary import cursor_to_df, write_tab_file
 from gridpath.auxiliary.dynamic_components import capacity_type_operational_period_sets
 from gridpath.auxiliary.validations import (
-    write_validation_to_database,
+    write_validations_to_database,
     validate_values,
     get_expected_dtypes,
     get_projects,
@@ -59,9 +58,8 @@ from gridpath.auxiliary.validations import (
     validate_column_monotonicity,
 )
 from gridpath.project.capacity.capacity_types.common_methods import (
-    operational_periods_by_project_vintage,
+    operational_periods_by_vintage_and_lifetime,
     project_operational_periods,
-    project_vintages_operational_in_period,
     update_capacity_results_table,
 )
 
@@ -298,14 +296,58 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 ###############################################################################
 
 
+def vintage_lookups(mod):
+    """
+    :param mod: the model instance
+    :return: dictionary with the operational periods of each project-vintage
+        ('opr_prds_by_vnt'), the project-vintages operational in each period
+        ('opr_vnts_by_prd'), and the vintages of each project that are
+        operational in each period ('opr_vnts_by_prd_prj', keyed by
+        (period, project))
+
+    The lookups are built in a single pass over GEN_NEW_LIN_VNTS the first
+    time they are needed and are then stored on the model instance, so that
+    the derived set and expression rules can look them up directly.
+    """
+    lookups = getattr(mod, "_gen_new_lin_vintage_lookups", None)
+    if lookups is None:
+        # Look up the period start and end years once instead of for every
+        # project-vintage
+        period_years = tuple(
+            (p, mod.period_start_year[p], mod.period_end_year[p]) for p in mod.PERIODS
+        )
+
+        lookups = {
+            "opr_prds_by_vnt": dict(),
+            "opr_vnts_by_prd": dict(),
+            "opr_vnts_by_prd_prj": dict(),
+        }
+        # The operational periods only depend on the vintage and the
+        # lifetime, so compute them once for each combination
+        opr_prds_by_vnt_lifetime = dict()
+        for (prj, v) in mod.GEN_NEW_LIN_VNTS:
+            lifetime_yrs = mod.gen_new_lin_lifetime_yrs_by_vintage[prj, v]
+            if (v, lifetime_yrs) not in opr_prds_by_vnt_lifetime:
+                opr_prds_by_vnt_lifetime[
+                    v, lifetime_yrs
+                ] = operational_periods_by_vintage_and_lifetime(
+                    period_years=period_years,
+                    vintage=v,
+                    lifetime_yrs=lifetime_yrs,
+                )
+            opr_prds = opr_prds_by_vnt_lifetime[v, lifetime_yrs]
+            lookups["opr_prds_by_vnt"][prj, v] = opr_prds
+            for prd in opr_prds:
+                lookups["opr_vnts_by_prd"].setdefault(prd, []).append((prj, v))
+                lookups["opr_vnts_by_prd_prj"].setdefault((prd, prj), []).append(v)
+
+        mod._gen_new_lin_vintage_lookups = lookups
+
+    return lookups
+
+
 def operational_periods_by_generator_vintage(mod, prj, v):
-    return operational_periods_by_project_vintage(
-        periods=getattr(mod, "PERIODS"),
-        period_start_year=getattr(mod, "period_start_year"),
-        period_end_year=getattr(mod, "period_end_year"),
-        vintage=v,
-        lifetime_yrs=mod.gen_new_lin_lifetime_yrs_by_vintage[prj, v],
-    )
+    return vintage_lookups(mod)["opr_prds_by_vnt"][prj, v]
 
 
 def gen_new_lin_operational_periods(mod):
@@ -316,11 +358,7 @@ def gen_new_lin_operational_periods(mod):
 
 
 def gen_new_lin_vintages_operational_in_period(mod, p):
-    return project_vintages_operational_in_period(
-        project_vintage_set=mod.GEN_NEW_LIN_VNTS,
-        operational_periods_by_project_vintage_set=mod.OPR_PRDS_BY_GEN_NEW_LIN_VINTAGE,
-        period=p,
-    )
+    return vintage_lookups(mod)["opr_vnts_by_prd"].get(p, [])
 
 
 # Expression Rules
@@ -344,10 +382,11 @@ def gen_new_lin_capacity_rule(mod, g, p):
     in 2050, the capacity would be undefined (i.e. 0 for the purposes of the
     objective function).
     """
-    return sum(
-        mod.GenNewLin_Build_MW[g, v]
-        for (gen, v) in mod.GEN_NEW_LIN_VNTS_OPR_IN_PERIOD[p]
-        if gen == g
+    vintages = vintage_lookups(mod)["opr_vnts_by_prd_prj"][p, g]
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[1] * len(vintages),
+        linear_vars=[mod.GenNewLin_Build_MW[g, v] for v in vintages],
     )
 
 
@@ -362,7 +401,7 @@ def min_cum_build_rule(mod, g, p):
 
     Must build a certain amount of capacity by period p.
     """
-    if mod.gen_new_lin_min_cumulative_new_build_mw == 0:
+    if mod.gen_new_lin_min_cumulative_new_build_mw[g, p] == 0:
         return Constraint.Skip
     else:
         return (
@@ -410,11 +449,13 @@ def capacity_cost_rule(mod, g, p):
     capacity-build of a particular vintage times the annualized cost for
     that vintage summed over all vintages operational in the period.
     """
-    return sum(
-        mod.GenNewLin_Build_MW[g, v]
-        * mod.gen_new_lin_annualized_real_cost_per_mw_yr[g, v]
-        for (gen, v) in mod.GEN_NEW_LIN_VNTS_OPR_IN_PERIOD[p]
-        if gen == g
+    vintages = vintage_lookups(mod)["opr_vnts_by_prd_prj"][p, g]
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[
+            mod.gen_new_lin_annualized_real_cost_per_mw_yr[g, v] for v in vintages
+        ],
+        linear_vars=[mod.GenNewLin_Build_MW[g, v] for v in vintages],
     )
 
 
@@ -442,67 +483,62 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
 
     # TODO: throw an error when a generator of the 'gen_new_lin' capacity
     #   type is not found in new_build_option_vintage_costs.tab
-    data_portal.load(
-        filename=os.path.join(
+    # Read the file once with pandas and pass the data to the data portal
+    # directly; missing values (".") are left uninitialized as with
+    # data_portal.load, while other strings (e.g. "NA") are kept as they are
+    df = pd.read_csv(
+        os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "new_build_generator_vintage_costs.tab",
         ),
-        index=m.GEN_NEW_LIN_VNTS,
-        select=("project", "vintage", "lifetime_yrs", "annualized_real_cost_per_mw_yr"),
-        param=(
-            m.gen_new_lin_lifetime_yrs_by_vintage,
-            m.gen_new_lin_annualized_real_cost_per_mw_yr,
-        ),
+        sep="\t",
+        na_values=".",
+        keep_default_na=False,
     )
 
+    vintages = list(zip(df["project"], df["vintage"].tolist()))
+    data_portal.data()["GEN_NEW_LIN_VNTS"] = {None: vintages}
+    for param, column in [
+        ("gen_new_lin_lifetime_yrs_by_vintage", "lifetime_yrs"),
+        (
+            "gen_new_lin_annualized_real_cost_per_mw_yr",
+            "annualized_real_cost_per_mw_yr",
+        ),
+    ]:
+        data_portal.data()[param] = {
+            idx: float(v) for (idx, v) in zip(vintages, df[column]) if not pd.isna(v)
+        }
+
     # Min and max cumulative capacity
     project_vintages_with_min = list()
     project_vintages_with_max = list()
     min_cumulative_mw = dict()
     max_cumulative_mw = dict()
 
-    header = pd.read_csv(
-        os.path.join(
-            scenario_directory,
-            str(subproblem),
-            str(stage),
-            "inputs",
-            "new_build_generator_vintage_costs.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
-
-    optional_columns = ["min_cumulative_new_build_mw", "max_cumulative_new_build_mw"]
-    used_columns = [c for c in optional_columns if c in header]
-
-    df = pd.read_csv(
-        os.path.join(
-            scenario_directory,
-            str(subproblem),
-            str(stage),
-            "inputs",
-            "new_build_generator_vintage_costs.tab",
-        ),
-        sep="\t",
-        usecols=["project", "vintage"] + used_columns,
-    )
-
     # min_cumulative_new_build_mw is optional,
     # so GEN_NEW_LIN_VNTS_W_MIN_CONSTRAINT
     # and min_cumulative_new_build_mw simply won't be initialized if
     # min_cumulative_new_build_mw does not exist in the input file
+    # A minimum of zero is redundant since new capacity is non-negative, so
+    # we don't add those project-vintages to the set (and don't create a
+    # constraint for them)
     if "min_cumulative_new_build_mw" in df.columns:
-        for row in zip(df["project"], df["vintage"], df["min_cumulative_new_build_mw"]):
-            if row[2] != ".":
-                project_vintages_with_min.append((row[0], row[1]))
-                min_cumulative_mw[(row[0], row[1])] = float(row[2])
-            else:
-                pass
+        min_df = df[
+            df["min_cumulative_new_build_mw"].notna()
+            & (df["min_cumulative_new_build_mw"] != 0)
+        ]
+        project_vintages_with_min = list(
+            zip(min_df["project"], min_df["vintage"].tolist())
+        )
+        min_cumulative_mw = dict(
+            zip(
+                project_vintages_with_min,
+                min_df["min_cumulative_new_build_mw"].astype(float).tolist(),
+            )
+        )
     else:
         pass
 
@@ -511,12 +547,16 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     # and max_cumulative_new_build_mw simply won't be initialized if
     # max_cumulative_new_build_mw does not exist in the input file
     if "max_cumulative_new_build_mw" in df.columns:
-        for row in zip(df["project"], df["vintage"], df["max_cumulative_new_build_mw"]):
-            if row[2] != ".":
-                project_vintages_with_max.append((row[0], row[1]))
-                max_cumulative_mw[(row[0], row[1])] = float(row[2])
-            else:
-                pass
+        max_df = df[df["max_cumulative_new_build_mw"].notna()]
+        project_vintages_with_max = list(
+            zip(max_df["project"], max_df["vintage"].tolist())
+        )
+        max_cumulative_mw = dict(
+            zip(
+                project_vintages_with_max,
+                max_df["max_cumulative_new_build_mw"].astype(float).tolist(),
+            )
+        )
     else:
         pass
 
@@ -548,7 +588,21 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     :param d:
     :return:
     """
-    with open(
+    technology = m.technology.extract_values()
+    load_zone = m.load_zone.extract_values()
+    new_build_mw = m.GenNewLin_Build_MW.extract_values()
+    vintages = list(m.GEN_NEW_LIN_VNTS)
+    results_df = pd.DataFrame(
+        data={
+            "project": [prj for (prj, p) in vintages],
+            "vintage": [p for (prj, p) in vintages],
+            "technology": [technology[prj] for (prj, p) in vintages],
+            "load_zone": [load_zone[prj] for (prj, p) in vintages],
+            "new_build_mw": [new_build_mw[prj, p] for (prj, p) in vintages],
+        },
+        dtype=object,
+    )
+    results_df.to_csv(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -556,24 +610,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             "results",
             "capacity_gen_new_lin.csv",
         ),
-        "w",
-        newline="",
-    ) as f:
-
-        writer = csv.writer(f)
-        writer.writerow(
-            ["project", "vintage", "technology", "load_zone", "new_build_mw"]
-        )
-        for (prj, p) in m.GEN_NEW_LIN_VNTS:
-            writer.writerow(
-                [
-                    prj,
-                    p,
-                    m.technology[prj],
-                    m.load_zone[prj],
-                    value(m.GenNewLin_Build_MW[prj, p]),
-                ]
-            )
+        index=False,
+        # Same line endings as the csv module's default
+        line_terminator="\r\n",
+    )
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
@@ -586,7 +626,8 @@ def summarize_results(scenario_directory, subproblem, stage, summary_results_fil
     :return:
     """
 
-    # Get the results CSV as dataframe
+    # Get the results CSV as dataframe; only the columns we summarize are
+    # parsed and the load zones and technologies are read as categoricals
     capacity_results_df = pd.read_csv(
         os.path.join(
             scenario_directory,
@@ -594,19 +635,26 @@ def summarize_results(scenario_directory, subproblem, stage, summary_results_fil
             str(stage),
             "results",
             "capacity_gen_new_lin.csv",
-        )
+        ),
+        usecols=["load_zone", "technology", "vintage", "new_build_mw"],
+        dtype={"load_zone": "category", "technology": "category"},
     )
 
-    capacity_results_agg_df = capacity_results_df.groupby(
-        by=["load_zone", "technology", "vintage"], as_index=True
-    ).sum()
+    # With observed=True, pandas does not always sort categorical group keys,
+    # so sort explicitly to keep the summary in load zone/technology/vintage
+    # order
+    capacity_results_agg_df = (
+        capacity_results_df.groupby(
+            by=["load_zone", "technology", "vintage"], as_index=True, observed=True
+        )
+        .sum()
+        .sort_index()
+    )
 
     # Get all technologies with the new build capacity
-    new_build_df = pd.DataFrame(
-        capacity_results_agg_df[capacity_results_agg_df["new_build_mw"] > 0][
-            "new_build_mw"
-        ]
-    )
+    new_build_df = capacity_results_agg_df.loc[
+        capacity_results_agg_df["new_build_mw"] > 0, ["new_build_mw"]
+    ]
 
     # Get the power units from the units.csv file
     units_df = pd.read_csv(
@@ -706,32 +754,27 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=new_gen_costs,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "new_build_generator_vintage_costs.tab",
         ),
-        "w",
-        newline="",
-    ) as new_gen_costs_tab_file:
-        writer = csv.writer(new_gen_costs_tab_file, delimiter="\t", lineterminator="\n")
-
-        # Write header
-        writer.writerow(
-            ["project", "vintage", "lifetime_yrs", "annualized_real_cost_per_mw_yr"]
-            + (
-                []
-                if subscenarios.PROJECT_NEW_POTENTIAL_SCENARIO_ID is None
-                else ["min_cumulative_new_build_mw", "max_cumulative_new_build_mw"]
-            )
-        )
-
-        for row in new_gen_costs:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "project",
+            "vintage",
+            "lifetime_yrs",
+            "annualized_real_cost_per_mw_yr",
+        ]
+        + (
+            []
+            if subscenarios.PROJECT_NEW_POTENTIAL_SCENARIO_ID is None
+            else ["min_cumulative_new_build_mw", "max_cumulative_new_build_mw"]
+        ),
+    )
 
 
 def import_results_into_database(
@@ -792,6 +835,24 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     # get the project lists
     cost_projects = cost_df["project"].unique()
 
+    # Check that all binary new build projects are available in >=1 vintage
+    msg = "Expected cost data for at least one vintage."
+    idx_errors = validate_idxs(
+        actual_idxs=cost_projects, req_idxs=projects, idx_label="project", msg=msg
+    )
+
+    # Without any cost inputs, missing projects are the only possible errors
+    if cost_df.empty:
+        write_validations_to_database(
+            conn=conn,
+            scenario_id=scenario_id,
+            subproblem_id=subproblem,
+            stage_id=stage,
+            gridpath_module=__name__,
+            validations=[("inputs_project_new_cost", "Mid", idx_errors)],
+        )
+        return
+
     # Get expected dtypes
     expected_dtypes = get_expected_dtypes(
         conn=conn, tables=["inputs_project_new_cost", "inputs_project_new_potential"]
@@ -799,73 +860,50 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
 
     # Check dtypes
     dtype_errors, error_columns = validate_dtypes(cost_df, expected_dtypes)
-    write_validation_to_database(
-        conn=conn,
-        scenario_id=scenario_id,
-        subproblem_id=subproblem,
-        stage_id=stage,
-        gridpath_module=__name__,
-        db_table="inputs_project_new_cost",
-        severity="High",
-        errors=dtype_errors,
-    )
 
     # Check valid numeric columns are non-negative
     numeric_columns = [c for c in cost_df.columns if expected_dtypes[c] == "numeric"]
     valid_numeric_columns = set(numeric_columns) - set(error_columns)
-    write_validation_to_database(
-        conn=conn,
-        scenario_id=scenario_id,
-        subproblem_id=subproblem,
-        stage_id=stage,
-        gridpath_module=__name__,
-        db_table="inputs_project_new_cost",
-        severity="High",
-        errors=validate_values(cost_df, valid_numeric_columns, min=0),
-    )
+    value_errors = validate_values(cost_df, valid_numeric_columns, min=0)
 
-    # Check that all binary new build projects are available in >=1 vintage
-    msg = "Expected cost data for at least one vintage."
-    write_validation_to_database(
-        conn=conn,
-        scenario_id=scenario_id,
-        subproblem_id=subproblem,
-        stage_id=stage,
-        gridpath_module=__name__,
-        db_table="inputs_project_new_cost",
-        severity="Mid",
-        errors=validate_idxs(
-            actual_idxs=cost_projects, req_idxs=projects, idx_label="project", msg=msg
-        ),
-    )
+    validations = [
+        ("inputs_project_new_cost", "High", dtype_errors),
+        ("inputs_project_new_cost", "High", value_errors),
+        ("inputs_project_new_cost", "Mid", idx_errors),
+    ]
 
     cols = ["min_cumulative_new_build_mw", "max_cumulative_new_build_mw"]
+    has_max = cols[1] in df_cols
+    has_min_and_max = has_max and cols[0] in df_cols
+
     # Check that maximum new build doesn't decrease
-    if cols[1] in df_cols:
-        write_validation_to_database(
-            conn=conn,
-            scenario_id=scenario_id,
-            subproblem_id=subproblem,
-            stage_id=stage,
-            gridpath_module=__name__,
-            db_table="inputs_project_new_potential",
-            severity="Mid",
-            errors=validate_row_monotonicity(
-                df=cost_df, col=cols[1], rank_col="vintage"
-            ),
+    if has_max:
+        validations.append(
+            (
+                "inputs_project_new_potential",
+                "Mid",
+                validate_row_monotonicity(df=cost_df, col=cols[1], rank_col="vintage"),
+            )
         )
 
     # check that min build <= max build
-    if set(cols).issubset(set(df_cols)):
-        write_validation_to_database(
-            conn=conn,
-            scenario_id=scenario_id,
-            subproblem_id=subproblem,
-            stage_id=stage,
-            gridpath_module=__name__,
-            db_table="inputs_project_new_potential",
-            severity="High",
-            errors=validate_column_monotonicity(
-                df=cost_df, cols=cols, idx_col=["project", "vintage"]
-            ),
+    if has_min_and_max:
+        validations.append(
+            (
+                "inputs_project_new_potential",
+                "High",
+                validate_column_monotonicity(
+                    df=cost_df, cols=cols, idx_col=["project", "vintage"]
+                ),
+            )
         )
+
+    # Write all validation errors to the database at once
+    write_validations_to_database(
+        conn=conn,
+        scenario_id=scenario_id,
+        subproblem_id=subproblem,
+        stage_id=stage,
+        gridpath_module=__name__,
+        validations=validations,
+    )
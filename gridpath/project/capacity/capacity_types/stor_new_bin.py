@@ -30,12 +30,12 @@ incurred by binary new-build storage.
 
 from __future__ import print_function
 
-import csv
 import os.path
 import pandas as pd
-from pyomo.environ import Set, Param, Var, NonNegativeReals, Constraint, value, Binary
+from pyomo.environ import Set, Param, Var, NonNegativeReals, Constraint, Binary
+from pyomo.core.expr.numeric_expr import LinearExpression
 
-from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.auxiliary import cursor_to_df, write_tab_file
 from gridpath.auxiliary.dynamic_components import capacity_type_operational_period_sets
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
@@ -46,8 +46,7 @@ from gridpath.auxiliary.validations import (
     validate_idxs,
 )
 from gridpath.project.capacity.capacity_types.common_methods import (
-    operational_periods_by_project_vintage,
-    project_operational_periods,
+    operational_periods_by_vintage_and_lifetime,
     project_vintages_operational_in_period,
     update_capacity_results_table,
 )
@@ -239,21 +238,69 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 ###############################################################################
 
 
+def vintage_lookups(mod):
+    """
+    :param mod: the model instance
+    :return: dictionary with the operational periods of each project-vintage
+        ('opr_prds_by_vnt'), the vintages of each project that are
+        operational in each period ('opr_vnts_by_prd_prj', keyed by
+        (period, project)), and the capacity cost of building each
+        project-vintage at its power and energy build size
+        ('cost_per_build_by_vnt')
+
+    The lookups are built in a single pass over STOR_NEW_BIN_VNTS the first
+    time they are needed and are then stored on the model instance, so that
+    the derived set, constraint, and capacity rules can look them up directly.
+    """
+    lookups = getattr(mod, "_stor_new_bin_vintage_lookups", None)
+    if lookups is None:
+        # Look up the period start and end years once instead of for every
+        # project-vintage
+        period_years = tuple(
+            (p, mod.period_start_year[p], mod.period_end_year[p]) for p in mod.PERIODS
+        )
+
+        lookups = {
+            "opr_prds_by_vnt": dict(),
+            "opr_vnts_by_prd_prj": dict(),
+            "cost_per_build_by_vnt": dict(),
+        }
+        # The operational periods only depend on the vintage and the
+        # lifetime, so compute them once for each combination
+        opr_prds_by_vnt_lifetime = dict()
+        for (prj, v) in mod.STOR_NEW_BIN_VNTS:
+            lookups["cost_per_build_by_vnt"][prj, v] = (
+                mod.stor_new_bin_build_size_mw[prj]
+                * mod.stor_new_bin_annualized_real_cost_per_mw_yr[prj, v]
+                + mod.stor_new_bin_build_size_mwh[prj]
+                * mod.stor_new_bin_annualized_real_cost_per_mwh_yr[prj, v]
+            )
+            lifetime_yrs = mod.stor_new_bin_lifetime_yrs[prj, v]
+            if (v, lifetime_yrs) not in opr_prds_by_vnt_lifetime:
+                opr_prds_by_vnt_lifetime[
+                    v, lifetime_yrs
+                ] = operational_periods_by_vintage_and_lifetime(
+                    period_years=period_years,
+                    vintage=v,
+                    lifetime_yrs=lifetime_yrs,
+                )
+            opr_prds = opr_prds_by_vnt_lifetime[v, lifetime_yrs]
+            lookups["opr_prds_by_vnt"][prj, v] = opr_prds
+            for prd in opr_prds:
+                lookups["opr_vnts_by_prd_prj"].setdefault((prd, prj), []).append(v)
+
+        mod._stor_new_bin_vintage_lookups = lookups
+
+    return lookups
+
+
 def operational_periods_by_storage_vintage(mod, prj, v):
-    return operational_periods_by_project_vintage(
-        periods=getattr(mod, "PERIODS"),
-        period_start_year=getattr(mod, "period_start_year"),
-        period_end_year=getattr(mod, "period_end_year"),
-        vintage=v,
-        lifetime_yrs=mod.stor_new_bin_lifetime_yrs[prj, v],
-    )
+    return vintage_lookups(mod)["opr_prds_by_vnt"][prj, v]
 
 
 def stor_new_bin_operational_periods(mod):
-    return project_operational_periods(
-        project_vintages_set=mod.STOR_NEW_BIN_VNTS,
-        operational_periods_by_project_vintage_set=mod.OPR_PRDS_BY_STOR_NEW_BIN_VINTAGE,
-    )
+    opr_prds_by_vnt = vintage_lookups(mod)["opr_prds_by_vnt"]
+    return {(g, p) for (g, v) in mod.STOR_NEW_BIN_VNTS for p in opr_prds_by_vnt[g, v]}
 
 
 def stor_new_bin_vintages_operational_in_period(mod, p):
@@ -285,8 +332,7 @@ def only_build_once_rule(mod, g, p):
     return (
         sum(
             mod.StorNewBin_Build[g, v]
-            for (gen, v) in mod.STOR_NEW_BIN_VNTS_OPR_IN_PRD[p]
-            if gen == g
+            for v in vintage_lookups(mod)["opr_vnts_by_prd_prj"][p, g]
         )
         <= 1
     )
@@ -305,10 +351,11 @@ def capacity_rule(mod, g, p):
     Note: only one vintage can have a non-zero StorNewBin_Build variable in
     each period due to the *only_build_once_rule*.
     """
-    return sum(
-        mod.StorNewBin_Build[g, v] * mod.stor_new_bin_build_size_mw[g]
-        for (gen, v) in mod.STOR_NEW_BIN_VNTS_OPR_IN_PRD[p]
-        if gen == g
+    vintages = vintage_lookups(mod)["opr_vnts_by_prd_prj"][p, g]
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[mod.stor_new_bin_build_size_mw[g]] * len(vintages),
+        linear_vars=[mod.StorNewBin_Build[g, v] for v in vintages],
     )
 
 
@@ -321,10 +368,11 @@ def energy_capacity_rule(mod, g, p):
     Note: only one vintage can have a non-zero StorNewBin_Build variable in
     each period due to the *only_build_once_rule*.
     """
-    return sum(
-        mod.StorNewBin_Build[g, v] * mod.stor_new_bin_build_size_mwh[g]
-        for (gen, v) in mod.STOR_NEW_BIN_VNTS_OPR_IN_PRD[p]
-        if gen == g
+    vintages = vintage_lookups(mod)["opr_vnts_by_prd_prj"][p, g]
+    return LinearExpression(
+        constant=0,
+        linear_coefs=[mod.stor_new_bin_build_size_mwh[g]] * len(vintages),
+        linear_vars=[mod.StorNewBin_Build[g, v] for v in vintages],
     )
 
 
@@ -337,16 +385,10 @@ def capacity_cost_rule(mod, g, p):
     operational in the period. Note that power and energy costs are additive.
     """
 
+    lookups = vintage_lookups(mod)
     return sum(
-        mod.StorNewBin_Build[g, v]
-        * (
-            mod.stor_new_bin_build_size_mw[g]
-            * mod.stor_new_bin_annualized_real_cost_per_mw_yr[g, v]
-            + mod.stor_new_bin_build_size_mwh[g]
-            * mod.stor_new_bin_annualized_real_cost_per_mwh_yr[g, v]
-        )
-        for (gen, v) in mod.STOR_NEW_BIN_VNTS_OPR_IN_PRD[p]
-        if gen == g
+        mod.StorNewBin_Build[g, v] * lookups["cost_per_build_by_vnt"][g, v]
+        for v in lookups["opr_vnts_by_prd_prj"][p, g]
     )
 
 
@@ -380,42 +422,66 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     # TODO: once we align param names and column names, we will have conflict
     #   because binary storage and generator use same build size param name
     #   in the columns.
-    data_portal.load(
-        filename=os.path.join(
+    # Read the files with pandas and pass the data to the data portal
+    # directly; missing values (".") are left uninitialized as with
+    # data_portal.load, while other strings (e.g. "NA") are kept as they are
+    costs_df = pd.read_csv(
+        os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "new_binary_build_storage_vintage_costs.tab",
         ),
-        index=m.STOR_NEW_BIN_VNTS,
-        select=(
-            "project",
-            "vintage",
-            "lifetime_yrs",
+        sep="\t",
+        na_values=".",
+        keep_default_na=False,
+    )
+
+    vintages = list(zip(costs_df["project"], costs_df["vintage"].tolist()))
+    data_portal.data()["STOR_NEW_BIN_VNTS"] = {None: vintages}
+    for param, column in [
+        ("stor_new_bin_lifetime_yrs", "lifetime_yrs"),
+        (
+            "stor_new_bin_annualized_real_cost_per_mw_yr",
             "annualized_real_cost_per_mw_yr",
-            "annualized_real_cost_per_mwh_yr",
         ),
-        param=(
-            m.stor_new_bin_lifetime_yrs,
-            m.stor_new_bin_annualized_real_cost_per_mw_yr,
-            m.stor_new_bin_annualized_real_cost_per_mwh_yr,
+        (
+            "stor_new_bin_annualized_real_cost_per_mwh_yr",
+            "annualized_real_cost_per_mwh_yr",
         ),
-    )
-
-    data_portal.load(
-        filename=os.path.join(
+    ]:
+        data_portal.data()[param] = {
+            idx: float(v)
+            for (idx, v) in zip(vintages, costs_df[column])
+            if not pd.isna(v)
+        }
+
+    size_df = pd.read_csv(
+        os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "new_binary_build_storage_size.tab",
         ),
-        index=m.STOR_NEW_BIN,
-        select=("project", "binary_build_size_mw", "binary_build_size_mwh"),
-        param=(m.stor_new_bin_build_size_mw, m.stor_new_bin_build_size_mwh),
+        sep="\t",
+        na_values=".",
+        keep_default_na=False,
     )
 
+    projects = size_df["project"].tolist()
+    data_portal.data()["STOR_NEW_BIN"] = {None: projects}
+    for param, column in [
+        ("stor_new_bin_build_size_mw", "binary_build_size_mw"),
+        ("stor_new_bin_build_size_mwh", "binary_build_size_mwh"),
+    ]:
+        data_portal.data()[param] = {
+            prj: float(v)
+            for (prj, v) in zip(projects, size_df[column])
+            if not pd.isna(v)
+        }
+
 
 def export_results(scenario_directory, subproblem, stage, m, d):
     """
@@ -427,7 +493,29 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     :param d:
     :return:
     """
-    with open(
+    technology = m.technology.extract_values()
+    load_zone = m.load_zone.extract_values()
+    build_size_mw = m.stor_new_bin_build_size_mw.extract_values()
+    build_size_mwh = m.stor_new_bin_build_size_mwh.extract_values()
+    new_build_binary = m.StorNewBin_Build.extract_values()
+    vintages = list(m.STOR_NEW_BIN_VNTS)
+    results_df = pd.DataFrame(
+        data={
+            "project": [prj for (prj, v) in vintages],
+            "vintage": [v for (prj, v) in vintages],
+            "technology": [technology[prj] for (prj, v) in vintages],
+            "load_zone": [load_zone[prj] for (prj, v) in vintages],
+            "new_build_binary": [new_build_binary[prj, v] for (prj, v) in vintages],
+            "new_build_mw": [
+                new_build_binary[prj, v] * build_size_mw[prj] for (prj, v) in vintages
+            ],
+            "new_build_mwh": [
+                new_build_binary[prj, v] * build_size_mwh[prj] for (prj, v) in vintages
+            ],
+        },
+        dtype=object,
+    )
+    results_df.to_csv(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -435,37 +523,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             "results",
             "capacity_stor_new_bin.csv",
         ),
-        "w",
-        newline="",
-    ) as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "project",
-                "vintage",
-                "technology",
-                "load_zone",
-                "new_build_binary",
-                "new_build_mw",
-                "new_build_mwh",
-            ]
-        )
-        for (prj, v) in m.STOR_NEW_BIN_VNTS:
-            writer.writerow(
-                [
-                    prj,
-                    v,
-                    m.technology[prj],
-                    m.load_zone[prj],
-                    value(m.StorNewBin_Build[prj, v]),
-                    value(
-                        m.StorNewBin_Build[prj, v] * m.stor_new_bin_build_size_mw[prj]
-                    ),
-                    value(
-                        m.StorNewBin_Build[prj, v] * m.stor_new_bin_build_size_mwh[prj]
-                    ),
-                ]
-            )
+        index=False,
+        # Same line endings as the csv module's default
+        line_terminator="\r\n",
+    )
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
@@ -478,7 +539,10 @@ def summarize_results(scenario_directory, subproblem, stage, summary_results_fil
     :return:
     """
 
-    # Get the results CSV as dataframe
+    new_build_columns = ["new_build_mw", "new_build_mwh"]
+
+    # Get the results CSV as dataframe; only the columns we summarize are
+    # parsed and the load zones and technologies are read as categoricals
     capacity_results_df = pd.read_csv(
         os.path.join(
             scenario_directory,
@@ -486,20 +550,27 @@ def summarize_results(scenario_directory, subproblem, stage, summary_results_fil
             str(stage),
             "results",
             "capacity_stor_new_bin.csv",
-        )
+        ),
+        usecols=["load_zone", "technology", "vintage"] + new_build_columns,
+        dtype={"load_zone": "category", "technology": "category"},
     )
 
-    capacity_results_agg_df = capacity_results_df.groupby(
-        by=["load_zone", "technology", "vintage"], as_index=True
-    ).sum()
+    # With observed=True, pandas does not always sort categorical group keys,
+    # so sort explicitly to keep the summary in load zone/technology/vintage
+    # order
+    capacity_results_agg_df = (
+        capacity_results_df.groupby(
+            by=["load_zone", "technology", "vintage"], as_index=True, observed=True
+        )[new_build_columns]
+        .sum()
+        .sort_index()
+    )
 
     # Get all technologies with new build storage power OR energy capacity
-    new_build_df = pd.DataFrame(
-        capacity_results_agg_df[
-            (capacity_results_agg_df["new_build_mw"] > 0)
-            | (capacity_results_agg_df["new_build_mwh"] > 0)
-        ][["new_build_mw", "new_build_mwh"]]
-    )
+    new_build_df = capacity_results_agg_df.loc[
+        (capacity_results_agg_df[new_build_columns].to_numpy() > 0).any(axis=1),
+        new_build_columns,
+    ]
 
     # Get the power and energy units from the units.csv file
     units_df = pd.read_csv(
@@ -547,22 +618,23 @@ def get_model_inputs_from_database(scenario_id, subscenarios, subproblem, stage,
         CROSS JOIN
             (SELECT period AS vintage
             FROM inputs_temporal_periods
-            WHERE temporal_scenario_id = {}) as relevant_vintages
+            WHERE temporal_scenario_id = ?) as relevant_vintages
         
         INNER JOIN
             (SELECT project, vintage, lifetime_yrs,
             annualized_real_cost_per_mw_yr, annualized_real_cost_per_mwh_yr
             FROM inputs_project_new_cost
-            WHERE project_new_cost_scenario_id = {}) as cost
+            WHERE project_new_cost_scenario_id = ?) as cost
         USING (project, vintage)
         
-        WHERE project_portfolio_scenario_id = {}
+        WHERE project_portfolio_scenario_id = ?
         AND capacity_type = 'stor_new_bin'
-        ;""".format(
+        ;""",
+        (
             subscenarios.TEMPORAL_SCENARIO_ID,
             subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        )
+        ),
     )
 
     c2 = conn.cursor()
@@ -573,14 +645,15 @@ def get_model_inputs_from_database(scenario_id, subscenarios, subproblem, stage,
         INNER JOIN
             (SELECT project, binary_build_size_mw, binary_build_size_mwh
             FROM inputs_project_new_binary_build_size
-            WHERE project_new_binary_build_size_scenario_id = {})
+            WHERE project_new_binary_build_size_scenario_id = ?)
         USING (project)
 
-        WHERE project_portfolio_scenario_id = {}
-        AND capacity_type = 'stor_new_bin';""".format(
+        WHERE project_portfolio_scenario_id = ?
+        AND capacity_type = 'stor_new_bin';""",
+        (
             subscenarios.PROJECT_NEW_BINARY_BUILD_SIZE_SCENARIO_ID,
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        )
+        ),
     )
 
     return new_stor_costs, new_stor_build_size
@@ -605,57 +678,35 @@ def write_model_inputs(
         scenario_id, subscenarios, subproblem, stage, conn
     )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=new_stor_costs,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "new_binary_build_storage_vintage_costs.tab",
         ),
-        "w",
-        newline="",
-    ) as new_storage_costs_tab_file:
-        writer = csv.writer(
-            new_storage_costs_tab_file, delimiter="\t", lineterminator="\n"
-        )
-
-        # Write header
-        writer.writerow(
-            [
-                "project",
-                "vintage",
-                "lifetime_yrs",
-                "annualized_real_cost_per_mw_yr",
-                "annualized_real_cost_per_mwh_yr",
-            ]
-        )
-
-        for row in new_stor_costs:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=[
+            "project",
+            "vintage",
+            "lifetime_yrs",
+            "annualized_real_cost_per_mw_yr",
+            "annualized_real_cost_per_mwh_yr",
+        ],
+    )
 
-    with open(
-        os.path.join(
+    write_tab_file(
+        cursor=new_stor_build_size,
+        file_path=os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "inputs",
             "new_binary_build_storage_size.tab",
         ),
-        "w",
-        newline="",
-    ) as new_build_size_tab_file:
-        writer = csv.writer(
-            new_build_size_tab_file, delimiter="\t", lineterminator="\n"
-        )
-
-        # Write header
-        writer.writerow(["project", "binary_build_size_mw", "binary_build_size_mwh"])
-
-        for row in new_stor_build_size:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        columns=["project", "binary_build_size_mw", "binary_build_size_mwh"],
+    )
 
 
 def import_results_into_database(
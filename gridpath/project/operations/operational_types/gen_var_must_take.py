@@ -59,6 +59,17 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     | Two-dimensional set with generators of the :code:`gen_var_must_take`    |
     | operational type and their operational timepoints.                      |
     +-------------------------------------------------------------------------+
+    | | :code:`GEN_VAR_MUST_TAKE_UP_RSV_OPR_TMPS`                             |
+    |                                                                         |
+    | Two-dimensional set with the operational timepoints of the              |
+    | :code:`gen_var_must_take` generators that have upward reserve variables.|
+    +-------------------------------------------------------------------------+
+    | | :code:`GEN_VAR_MUST_TAKE_DOWN_RSV_OPR_TMPS`                           |
+    |                                                                         |
+    | Two-dimensional set with the operational timepoints of the              |
+    | :code:`gen_var_must_take` generators that have downward reserve         |
+    | variables.                                                              |
+    +-------------------------------------------------------------------------+
 
     |
 
@@ -79,12 +90,12 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     | Constraints                                                             |
     +=========================================================================+
     | | :code:`GenVarMustTake_No_Upward_Reserves_Constraint`                  |
-    | | *Defined over*: :code:`GEN_VAR_MUST_TAKE_OPR_TMPS`                    |
+    | | *Defined over*: :code:`GEN_VAR_MUST_TAKE_UP_RSV_OPR_TMPS`             |
     |                                                                         |
     | Variable must-take generator projects cannot provide upward reserves.   |
     +-------------------------------------------------------------------------+
     | | :code:`GenVarMustTake_No_Downward_Reserves_Constraint`                |
-    | | *Defined over*: :code:`GEN_VAR_MUST_TAKE_OPR_TMPS`                    |
+    | | *Defined over*: :code:`GEN_VAR_MUST_TAKE_DOWN_RSV_OPR_TMPS`           |
     |                                                                         |
     | Variable must-take generator projects cannot provide downward reserves. |
     +-------------------------------------------------------------------------+
@@ -105,9 +116,27 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.GEN_VAR_MUST_TAKE_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: list(
-            set((g, tmp) for (g, tmp) in mod.PRJ_OPR_TMPS if g in mod.GEN_VAR_MUST_TAKE)
-        ),
+        initialize=gen_var_must_take_opr_tmps,
+    )
+
+    m.GEN_VAR_MUST_TAKE_UP_RSV_OPR_TMPS = Set(
+        dimen=2,
+        within=m.GEN_VAR_MUST_TAKE_OPR_TMPS,
+        initialize=lambda mod: [
+            (g, tmp)
+            for (g, tmp) in mod.GEN_VAR_MUST_TAKE_OPR_TMPS
+            if getattr(d, headroom_variables)[g]
+        ],
+    )
+
+    m.GEN_VAR_MUST_TAKE_DOWN_RSV_OPR_TMPS = Set(
+        dimen=2,
+        within=m.GEN_VAR_MUST_TAKE_OPR_TMPS,
+        initialize=lambda mod: [
+            (g, tmp)
+            for (g, tmp) in mod.GEN_VAR_MUST_TAKE_OPR_TMPS
+            if getattr(d, footroom_variables)[g]
+        ],
     )
 
     # Required Params
@@ -123,31 +152,27 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     def no_upward_reserve_rule(mod, g, tmp):
         """
         **Constraint Name**: GenVarMustTake_No_Upward_Reserves_Constraint
-        **Enforced Over**: GEN_VAR_MUST_TAKE_OPR_TMPS
+        **Enforced Over**: GEN_VAR_MUST_TAKE_UP_RSV_OPR_TMPS
 
         Upward reserves should be zero in every operational timepoint.
         """
-        if getattr(d, headroom_variables)[g]:
-            warnings.warn(
-                """project {} is of the 'gen_var_must_take' operational 
-                type and should not be assigned any upward reserve BAs since it 
-                cannot provide  upward reserves. Please replace the upward 
-                reserve BA for project {} with '.' (no value) in projects.tab. 
-                Model will add  constraint to ensure project {} cannot provide 
-                upward reserves
-                """.format(
-                    g, g, g
-                )
-            )
-            return (
-                sum(getattr(mod, c)[g, tmp] for c in getattr(d, headroom_variables)[g])
-                == 0
+        warnings.warn(
+            """project {} is of the 'gen_var_must_take' operational 
+            type and should not be assigned any upward reserve BAs since it 
+            cannot provide  upward reserves. Please replace the upward 
+            reserve BA for project {} with '.' (no value) in projects.tab. 
+            Model will add  constraint to ensure project {} cannot provide 
+            upward reserves
+            """.format(
+                g, g, g
             )
-        else:
-            return Constraint.Skip
+        )
+        return (
+            sum(getattr(mod, c)[g, tmp] for c in getattr(d, headroom_variables)[g]) == 0
+        )
 
     m.GenVarMustTake_No_Upward_Reserves_Constraint = Constraint(
-        m.GEN_VAR_MUST_TAKE_OPR_TMPS, rule=no_upward_reserve_rule
+        m.GEN_VAR_MUST_TAKE_UP_RSV_OPR_TMPS, rule=no_upward_reserve_rule
     )
 
     # TODO: remove this constraint once input validation is in place that
@@ -155,34 +180,46 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     def no_downward_reserve_rule(mod, g, tmp):
         """
         **Constraint Name**: GenVarMustTake_No_Downward_Reserves_Constraint
-        **Enforced Over**: GEN_VAR_MUST_TAKE_OPR_TMPS
+        **Enforced Over**: GEN_VAR_MUST_TAKE_DOWN_RSV_OPR_TMPS
 
         Downward reserves should be zero in every operational timepoint.
         """
-        if getattr(d, footroom_variables)[g]:
-            warnings.warn(
-                """project {} is of the 'gen_var_must_take' operational 
-                type and should not be assigned any downward reserve BAs since 
-                it cannot provide downward reserves. Please replace the
-                downward reserve BA for project {} with '.' (no value) in 
-                projects.tab. Model will add constraint to ensure project {} 
-                cannot provide downward reserves.
-                """.format(
-                    g, g, g
-                )
-            )
-            return (
-                sum(getattr(mod, c)[g, tmp] for c in getattr(d, footroom_variables)[g])
-                == 0
+        warnings.warn(
+            """project {} is of the 'gen_var_must_take' operational 
+            type and should not be assigned any downward reserve BAs since 
+            it cannot provide downward reserves. Please replace the
+            downward reserve BA for project {} with '.' (no value) in 
+            projects.tab. Model will add constraint to ensure project {} 
+            cannot provide downward reserves.
+            """.format(
+                g, g, g
             )
-        else:
-            return Constraint.Skip
+        )
+        return (
+            sum(getattr(mod, c)[g, tmp] for c in getattr(d, footroom_variables)[g]) == 0
+        )
 
     m.GenVarMustTake_No_Downward_Reserves_Constraint = Constraint(
-        m.GEN_VAR_MUST_TAKE_OPR_TMPS, rule=no_downward_reserve_rule
+        m.GEN_VAR_MUST_TAKE_DOWN_RSV_OPR_TMPS, rule=no_downward_reserve_rule
     )
 
 
+# Set Rules
+###############################################################################
+
+
+def gen_var_must_take_opr_tmps(mod):
+    """
+    The operational timepoints of the gen_var_must_take projects, in the
+    order of PRJ_OPR_TMPS. Project membership is checked against a plain
+    Python set rather than the Pyomo set.
+    """
+    gen_var_must_take_projects = set(mod.GEN_VAR_MUST_TAKE)
+    return [
+        (g, tmp) for (g, tmp) in mod.PRJ_OPR_TMPS if g in gen_var_must_take_projects
+    ]
+
+
 # Operational Type Methods
 ###############################################################################
 
@@ -207,38 +244,26 @@ def power_delta_rule(mod, g, tmp):
     This rule is only used in tuning costs, so fine to skip for linked
     horizon's first timepoint.
     """
-    if check_if_first_timepoint(
-        mod=mod, tmp=tmp, balancing_type=mod.balancing_type_project[g]
-    ) and (
+    balancing_type = mod.balancing_type_project[g]
+    if check_if_first_timepoint(mod=mod, tmp=tmp, balancing_type=balancing_type) and (
         check_boundary_type(
-            mod=mod,
-            tmp=tmp,
-            balancing_type=mod.balancing_type_project[g],
-            boundary_type="linear",
+            mod=mod, tmp=tmp, balancing_type=balancing_type, boundary_type="linear"
         )
         or check_boundary_type(
-            mod=mod,
-            tmp=tmp,
-            balancing_type=mod.balancing_type_project[g],
-            boundary_type="linked",
+            mod=mod, tmp=tmp, balancing_type=balancing_type, boundary_type="linked"
         )
     ):
         pass
     else:
+        prev_tmp = mod.prev_tmp[tmp, balancing_type]
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
             * mod.gen_var_must_take_cap_factor[g, tmp]
         ) - (
-            mod.Capacity_MW[
-                g, mod.period[mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
-            ]
-            * mod.Availability_Derate[
-                g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
-            ]
-            * mod.gen_var_must_take_cap_factor[
-                g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
-            ]
+            mod.Capacity_MW[g, mod.period[prev_tmp]]
+            * mod.Availability_Derate[g, prev_tmp]
+            * mod.gen_var_must_take_cap_factor[g, prev_tmp]
         )
 
 
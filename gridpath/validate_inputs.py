@@ -31,6 +31,7 @@ from gridpath.auxiliary.db_interface import (
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     validate_cols_equal,
+    clear_table_dtypes_cache,
 )
 from gridpath.common_functions import get_db_parser
 from gridpath.auxiliary.module_list import determine_modules, load_modules
@@ -423,10 +424,14 @@ def main(args=None):
         )
         loaded_modules = load_modules(modules_to_use=modules_to_use)
 
-        # Read in inputs from db and validate inputs for loaded modules
-        validate_inputs(
-            subproblem_structure, loaded_modules, scenario_id, subscenarios, conn
-        )
+        # Read in inputs from db and validate inputs for loaded modules; the
+        # table datatypes cached during the run are cleared when it's done
+        try:
+            validate_inputs(
+                subproblem_structure, loaded_modules, scenario_id, subscenarios, conn
+            )
+        finally:
+            clear_table_dtypes_cache()
     else:
         if not parsed_arguments.quiet:
             print("Invalid subscenario ID(s). Skipped detailed input validation.")
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os.path
 from pyomo.environ import AbstractModel
+import sqlite3
+import tempfile
 import unittest
 
 import gridpath.auxiliary.auxiliary as auxiliary_module_to_test
@@ -91,6 +94,37 @@ class TestAuxiliary(unittest.TestCase):
         self.assertEqual(True, auxiliary_module_to_test.is_number(100.5))
         self.assertEqual(False, auxiliary_module_to_test.is_number("string"))
 
+    def test_write_tab_file(self):
+        """
+        Check that values are written as returned by the database, NULLs are
+        written as ".", and lines end with "\\n"
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE table1 (ba TEXT, allow INTEGER, cost FLOAT);""")
+        conn.executemany(
+            """INSERT INTO table1 VALUES (?, ?, ?);""",
+            [("ba1", 1, 0.5), ("ba2", None, 10.0)],
+        )
+        cursor = conn.execute("""SELECT ba, allow, cost FROM table1;""")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "test.tab")
+            auxiliary_module_to_test.write_tab_file(
+                cursor=cursor,
+                file_path=file_path,
+                columns=["balancing_area", "allow_violation", "cost"],
+            )
+            with open(file_path, "r", newline="") as f:
+                actual = f.read()
+
+        expected = (
+            "balancing_area\tallow_violation\tcost\n" "ba1\t1\t0.5\n" "ba2\t.\t10.0\n"
+        )
+        self.assertEqual(expected, actual)
+
+        conn.close()
+
 
 if __name__ == "__main__":
     unittest.main()
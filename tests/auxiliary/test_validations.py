@@ -13,8 +13,10 @@
 # limitations under the License.
 
 import numpy as np
+import os.path
 import pandas as pd
 import sqlite3
+import tempfile
 import unittest
 
 import gridpath.auxiliary.validations as module_to_test
@@ -67,9 +69,50 @@ class TestValidations(unittest.TestCase):
         actual_dict = module_to_test.get_expected_dtypes(conn, ["table1", "table2"])
         self.assertDictEqual(expected_dict, actual_dict)
 
+        # In-memory database tables aren't cached
+        self.assertDictEqual({}, module_to_test._table_dtypes_cache)
+
         # Tear down: close connection
         conn.close()
 
+    def test_get_expected_dtypes_cache(self):
+        """
+        Check that the datatypes of database file tables are cached until the
+        cache is cleared
+        :return:
+        """
+
+        # Setup
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "test.db")
+            conn = sqlite3.connect(db_path)
+            conn.execute("""CREATE TABLE table1 (col1 INTEGER, col2 TEXT);""")
+            conn.commit()
+
+            expected_dict = {"col1": "numeric", "col2": "string"}
+            actual_dict = module_to_test.get_expected_dtypes(conn, ["table1"])
+            self.assertDictEqual(expected_dict, actual_dict)
+            self.assertListEqual(
+                ["table1"],
+                [table for (_, table) in module_to_test._table_dtypes_cache],
+            )
+
+            # Cached datatypes are used until the cache is cleared
+            conn.execute("""ALTER TABLE table1 ADD COLUMN col3 FLOAT;""")
+            conn.commit()
+            actual_dict = module_to_test.get_expected_dtypes(conn, ["table1"])
+            self.assertDictEqual(expected_dict, actual_dict)
+
+            module_to_test.clear_table_dtypes_cache()
+            self.assertDictEqual({}, module_to_test._table_dtypes_cache)
+            expected_dict = {"col1": "numeric", "col2": "string", "col3": "numeric"}
+            actual_dict = module_to_test.get_expected_dtypes(conn, ["table1"])
+            self.assertDictEqual(expected_dict, actual_dict)
+
+            # Tear down: clear the cache and close connection
+            module_to_test.clear_table_dtypes_cache()
+            conn.close()
+
     def test_validate_dtypes(self):
         """
 
@@ -239,6 +282,24 @@ class TestValidations(unittest.TestCase):
                     "project(s) 'coal_plant': Expected 0 <= 'average_heat_rate_mmbtu_per_mwh' <= 1"
                 ],
             },
+            # Make sure missing values aren't flagged
+            5: {
+                "df": pd.DataFrame(
+                    columns=cols,
+                    data=[
+                        ["gas_ct", None, -1],
+                        ["gas_ct", 0.5, None],
+                        ["coal_plant", None, 1.9],
+                    ],
+                ),
+                "min": 0,
+                "max": np.inf,
+                "strict_min": False,
+                "strict_max": False,
+                "result": [
+                    "project(s) 'gas_ct': Expected 0 <= 'average_heat_rate_mmbtu_per_mwh' <= inf"
+                ],
+            },
         }
 
         for test_case in test_cases.keys():
@@ -969,6 +1030,23 @@ class TestValidations(unittest.TestCase):
                     "decrease with period. "
                 ],
             },
+            # Non-numeric values are flagged rather than raising an error
+            7: {
+                "df": pd.DataFrame(
+                    columns=cols,
+                    data=[
+                        ["gas_ct", 2020, "5.0", 20],
+                        ["gas_ct", 2030, "abc", 20],
+                        ["coal", 2030, "xyz", 20],
+                    ],
+                ),
+                "col": ["max_mw"],
+                "increasing": True,
+                "result": [
+                    "project(s) 'gas_ct': max_mw should monotonically "
+                    "increase with period. "
+                ],
+            },
         }
         for test_case in test_cases.keys():
             expected_list = test_cases[test_case]["result"]
@@ -1050,6 +1128,23 @@ class TestValidations(unittest.TestCase):
                     "['min_mw', 'avg_mw', 'max_mw']. "
                 ],
             },
+            # Non-numeric values are flagged rather than raising an error
+            5: {
+                "df": pd.DataFrame(
+                    columns=cols,
+                    data=[
+                        ["gas_ct", 2020, "10", 15, 20],
+                        ["gas_ct", 2030, "abc", 15, 20],
+                        ["coal", 2030, 20, 20, 20],
+                    ],
+                ),
+                "cols": ["min_mw", "avg_mw", "max_mw"],
+                "idx_col": "project",
+                "result": [
+                    "project(s) ['gas_ct']: Values cannot decrease "
+                    "between ['min_mw', 'avg_mw', 'max_mw']. "
+                ],
+            },
         }
         for test_case in test_cases.keys():
             expected_list = test_cases[test_case]["result"]
@@ -0,0 +1,63 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import tempfile
+import unittest
+
+from pyomo.environ import DataPortal
+
+from gridpath.geography.common_functions import load_balancing_area_data
+
+
+class TestGeographyCommonFunctions(unittest.TestCase):
+    """
+    Test the common_functions module in the geography package.
+    """
+
+    def test_load_balancing_area_data(self):
+        """
+        Check that the balancing area data are loaded as expected, with "."
+        values left uninitialized and other strings (e.g. "NA") kept
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "test_balancing_areas.tab")
+            with open(file_path, "w", newline="") as f:
+                f.write(
+                    "balancing_area\tallow_violation\tviolation_penalty_per_mw\t"
+                    "reserve_to_energy_adjustment\n"
+                    "NA\t1\t10\t.\n"
+                    "None\t0\t.\t0.5\n"
+                )
+
+            data_portal = DataPortal()
+            load_balancing_area_data(
+                data_portal=data_portal,
+                file_path=file_path,
+                bas_set="BAS",
+                allow_violation_param="allow_violation",
+                violation_penalty_param="violation_penalty_per_mw",
+            )
+
+        expected_data = {
+            "BAS": {None: ["NA", "None"]},
+            "allow_violation": {"NA": 1, "None": 0},
+            "violation_penalty_per_mw": {"NA": 10.0},
+        }
+        self.assertDictEqual(expected_data, data_portal.data())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,7 +18,7 @@ from importlib import import_module
 import unittest
 
 
-NAME_OF_MODULE_BEING_TESTED = "project.capacity.capacity_types.gen_new_lin"
+NAME_OF_MODULE_BEING_TESTED = "project.capacity.capacity_types.common_methods"
 # Import the module we'll test
 try:
     MODULE_BEING_TESTED = import_module(
@@ -102,6 +102,35 @@ class TestCapacityTypeCommonMethods(unittest.TestCase):
                 expected_operational_periods, actual_operational_periods
             )
 
+    def test_operational_periods_by_vintage_and_lifetime(self):
+        """
+        Check that the operational periods are computed from the
+        (period, start year, end year) tuples as expected
+        :return:
+        """
+        period_years = (
+            (2020, 2020, 2029),
+            (2030, 2030, 2039),
+            (2040, 2040, 2049),
+            (2050, 2050, 2059),
+        )
+        test_cases = {
+            (2030, 20): (2030, 2040),
+            (2040, 10): (2040,),
+            (2020, 40): (2020, 2030, 2040, 2050),
+            (2060, 10): (),
+        }
+
+        for (vintage, lifetime_yrs), expected in test_cases.items():
+            self.assertTupleEqual(
+                expected,
+                MODULE_BEING_TESTED.operational_periods_by_vintage_and_lifetime(
+                    period_years=period_years,
+                    vintage=vintage,
+                    lifetime_yrs=lifetime_yrs,
+                ),
+            )
+
     def test_project_operational_periods(self):
         """
         G1 has lifetime of 30 years, G2 has lifetime of 10 years,